@@ -1,57 +1,427 @@
 '''Fun with Collatz Conjecture demo, with the intent of using no preconstructed algorithms'''
 
-SOLVED_LIST = []
+import os, threading
+from array import array
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor, wait, FIRST_COMPLETED
+
+class VerifiedSet:
+    '''Compact store of numbers known to satisfy the Collatz Conjecture.
+
+    Every number from 1 up to ``watermark`` is verified. Numbers above the watermark
+    are kept in a fixed-size bit array (one bit per number) that slides forward as the
+    watermark advances. Numbers too far above the watermark to fit in the window are
+    dropped, which is safe because the store is only used to cut paths short.
 
-def merge_sort(target: list) -> list:
-    '''Sorts a list in ascending order using the merge sort algorithm.
-    
     Args:
-        target (list): The list to sort.
-    
-    Returns:
-        list: A new sorted list.
-    
+        window (int): How many numbers past the start of the bit array can be tracked. Must be a positive multiple of 8. Defaults to 2**24 (2 MiB).
+
     Raises:
-        ValueError: If the input list is None.
+        ValueError: If the window is not a positive multiple of 8.
     '''
-    def merge(left: list, right: list) -> list:
-        '''Merges two sorted lists into a single sorted list.
+
+    def __init__(self, window: int = 1 << 24):
+        if window <= 0 or window % 8:
+            raise ValueError("Window must be a positive multiple of 8")
+
+        self.watermark = 1  # 1 trivially reaches 1
+        self.max_value = 1
+        self._base = 0  # Number represented by bit 0 of the array
+        self._bits = bytearray(window // 8)
+        self._lock = threading.Lock()  # Keeps the array and its base in step for snapshot()
+
+    def __contains__(self, number: int) -> bool:
+        '''Checks in O(1) whether a number is known to be verified.'''
+        if number <= self.watermark:
+            return number >= 1
+
+        offset = number - self._base
+        if offset >= len(self._bits) << 3:
+            return False
+
+        return bool(self._bits[offset >> 3] & (1 << (offset & 7)))
+
+    def add(self, number: int) -> None:
+        '''Marks a number as verified.
         
         Args:
-            left (list): A sorted list.
-            right (list): Another sorted list.
+            number (int): The verified number.
+        '''
+        if number > self.max_value:
+            self.max_value = number
+
+        if number <= self.watermark:
+            return
+
+        if number == self.watermark + 1:
+            self.watermark = number
+            self._advance()
+            return
+
+        offset = number - self._base
+        if offset < len(self._bits) << 3:
+            self._bits[offset >> 3] |= 1 << (offset & 7)
+
+    def update(self, numbers) -> None:
+        '''Marks every number in an iterable as verified.
+        
+        Args:
+            numbers: Any iterable of verified numbers. Sorted input advances the watermark fastest.
+        '''
+        for number in numbers:
+            self.add(number)
+
+    def add_range(self, start: int, stop: int) -> None:
+        '''Marks every number in [start, stop) as verified.
+
+        Args:
+            start (int): First verified number. Must not leave a gap above the watermark.
+            stop (int): One past the last verified number.
+
+        Raises:
+            ValueError: If start is more than one above the watermark.
+        '''
+        if start > self.watermark + 1:
+            raise ValueError(f"Range starting at {start:,} leaves a gap above the watermark {self.watermark:,}")
+
+        if stop - 1 > self.max_value:
+            self.max_value = stop - 1
+
+        if stop - 1 > self.watermark:
+            self.watermark = stop - 1
+            self._advance()
+
+    def values(self):
+        '''Yields every stored number in ascending order.'''
+        yield from range(1, self.watermark + 1)
+
+        bits = self._bits
+        for index in range(len(bits)):
+            byte = bits[index]
+            if not byte:
+                continue
+            for bit in range(8):
+                if byte & (1 << bit):
+                    number = self._base + (index << 3) + bit
+                    if number > self.watermark:
+                        yield number
+
+    def snapshot(self) -> tuple[int, int, bytes, int]:
+        '''Copies the store's state, safe to call from another thread while numbers are added.
         
         Returns:
-            list: A merged sorted list.
+            tuple[int, int, bytes, int]: The watermark, the number represented by bit 0, the bit array and the maximum value.
         '''
-        result = []
-        i = j = 0
+        with self._lock:
+            return self.watermark, self._base, bytes(self._bits), self.max_value
+
+    def restore(self, watermark: int, base: int, bits: bytes, max_value: int) -> None:
+        '''Replaces the store's state with one taken by snapshot().
         
-        while i < len(left) and j < len(right):
-            if left[i] < right[j]:
-                result.append(left[i])
-                i += 1
+        Args:
+            watermark (int): Every number up to this is verified.
+            base (int): Number represented by bit 0 of the array. Must be a multiple of 8 no higher than watermark + 1.
+            bits (bytes): The bit array. Its length sets the new window.
+            max_value (int): The highest verified number seen.
+        
+        Raises:
+            ValueError: If the base does not fit the watermark or the bit array is empty.
+        '''
+        if base % 8 or base > watermark + 1 or not bits:
+            raise ValueError("Snapshot does not describe a valid store")
+
+        with self._lock:
+            self.watermark = watermark
+            self.max_value = max(max_value, watermark)
+            self._base = base
+            self._bits = bytearray(bits)
+
+    def _advance(self) -> None:
+        '''Moves the watermark up past every consecutive verified number.'''
+        bits = self._bits
+        size = len(bits) << 3
+        offset = self.watermark + 1 - self._base
+
+        while offset < size:
+            byte = bits[offset >> 3]
+            if offset & 7 == 0 and byte == 0xFF:  # Skip full bytes at once
+                offset += 8
+                continue
+            if not byte & (1 << (offset & 7)):
+                break
+            offset += 1
+
+        self.watermark = self._base + offset - 1
+        self._slide()
+
+    def _slide(self) -> None:
+        '''Drops bytes below the watermark once they take up half of the window.'''
+        spent = (self.watermark + 1 - self._base) >> 3
+        if spent < len(self._bits) >> 1:
+            return
+
+        with self._lock:
+            if spent >= len(self._bits):  # Watermark jumped past the whole window
+                self._bits = bytearray(len(self._bits))
             else:
-                result.append(right[j])
-                j += 1
+                del self._bits[:spent]
+                self._bits.extend(bytes(spent))
+            self._base += spent << 3
+
+
+SOLVED = VerifiedSet()
+ENGINE = None  # Per-process StoppingTimes, created the first time a chunk needs delays
+
+
+class StoppingTimes:
+    '''Iterative total stopping time engine with a bounded memo.
+
+    Total stopping times and peaks for numbers below ``memo_size`` are kept in flat arrays,
+    and a small LRU cache holds recent larger numbers, so a new starting number only walks
+    until it reaches something already cached. Loops are caught with Brent's cycle
+    detection, which needs O(1) extra memory instead of a scan of the path.
+
+    Args:
+        memo_size (int): Numbers below this get a slot in the memo arrays (12 bytes each). Defaults to 2**20.
+        lru_size (int): Numbers at or above memo_size kept in the LRU cache. Defaults to 2**16.
+    '''
+
+    def __init__(self, memo_size: int = 1 << 20, lru_size: int = 1 << 16):
+        self.memo_size = memo_size
+        self.lru_size = lru_size
+        self._steps = array('I', bytes(4 * memo_size))  # Stored as steps + 1 so 0 means unknown
+        self._peaks = array('Q', bytes(8 * memo_size))
+        self._lru = OrderedDict()
+
+    def _lookup(self, number: int) -> tuple[int, int] | None:
+        if number < self.memo_size:
+            steps = self._steps[number]
+            return (steps - 1, self._peaks[number]) if steps else None
+
+        cached = self._lru.get(number)
+        if cached is not None:
+            self._lru.move_to_end(number)
+        return cached
+
+    def _store(self, number: int, steps: int, peak: int) -> None:
+        if number < self.memo_size:
+            if peak < 1 << 64:
+                self._steps[number] = steps + 1
+                self._peaks[number] = peak
+            return
+
+        if self.lru_size:
+            self._lru[number] = (steps, peak)
+            if len(self._lru) > self.lru_size:
+                self._lru.popitem(last=False)
+
+    def compute(self, number: int) -> tuple[int, int] | None:
+        '''Finds the total stopping time and peak value of a number.
+        
+        Args:
+            number (int): The starting number, at least 1.
         
-        result.extend(left[i:])
-        result.extend(right[j:])
+        Returns:
+            tuple[int, int] | None: Steps until reaching 1 and the highest value on the way, or None if the path loops without reaching 1.
         
-        return result
+        Raises:
+            ValueError: If the number is below 1.
+        '''
+        if number < 1:
+            raise ValueError("Stopping times are only defined for positive numbers")
+
+        path = []
+        value = number
+        tortoise = value
+        power = length = 1
+
+        while True:
+            if value == 1:
+                steps, peak = 0, 1
+                break
+
+            cached = self._lookup(value)
+            if cached is not None:
+                steps, peak = cached
+                break
+
+            path.append(value)
+
+            if value % 2 == 0:  # Even
+                value //= 2
+            else:  # Odd
+                value = 3 * value + 1
+
+            # Brent's cycle detection: the tortoise jumps to the hare at every power of two
+            if value == tortoise:
+                return None
+            if power == length:
+                tortoise = value
+                power *= 2
+                length = 0
+            length += 1
+
+        # Walk the path backwards so every number on it gets cached
+        for value in reversed(path):
+            steps += 1
+            if value > peak:
+                peak = value
+            self._store(value, steps, peak)
+
+        return steps, peak
+
+def merge_sort(target: list) -> list:
+    '''Sorts a list in ascending order using a bottom-up merge sort.
 
+    Runs of width 1, 2, 4, ... are merged back and forth between a copy of the list and a
+    single scratch buffer of the same size, so nothing is sliced and nothing recurses.
+    
+    Args:
+        target (list): The list to sort.
+    
+    Returns:
+        list: A new sorted list.
+    
+    Raises:
+        ValueError: If the input list is None.
+    '''
     if target is None:
         raise ValueError("List to sort must not be None")
+
+    source = list(target)
+    length = len(source)
+    if length <= 1:
+        return source
+
+    scratch = [None] * length
+    width = 1
+
+    while width < length:
+        for low in range(0, length, 2 * width):
+            mid = min(low + width, length)
+            high = min(low + 2 * width, length)
+            i, j, k = low, mid, low
+
+            while i < mid and j < high:
+                if source[j] < source[i]:
+                    scratch[k] = source[j]
+                    j += 1
+                else:
+                    scratch[k] = source[i]
+                    i += 1
+                k += 1
+
+            # Whichever half is left over is already in order
+            if i < mid:
+                scratch[k:high] = source[i:mid]
+            else:
+                scratch[k:high] = source[j:high]
+
+        source, scratch = scratch, source
+        width *= 2
+
+    return source
+
+def merge_files(left_name: str, right_name: str, destination_name: str) -> None:
+    '''Merges two files of sorted integers, one per line, into a third.
+
+    Only one value from each file is held in memory at a time.
+    
+    Args:
+        left_name (str): A file of sorted integers.
+        right_name (str): Another file of sorted integers.
+        destination_name (str): The file to write the merged integers to.
+    '''
+    with open(left_name, 'r') as left, open(right_name, 'r') as right, open(destination_name, 'w') as destination:
+        left_line = left.readline()
+        right_line = right.readline()
+
+        while left_line and right_line:
+            if int(right_line) < int(left_line):
+                destination.write(right_line)
+                right_line = right.readline()
+            else:
+                destination.write(left_line)
+                left_line = left.readline()
+
+        # Copy whatever is left of the unfinished file
+        remaining, rest = (left_line, left) if left_line else (right_line, right)
+        while remaining:
+            destination.write(remaining)
+            remaining = rest.readline()
+
+def sort_file(file_name: str, run_size: int = 1_000_000):
+    '''Yields the integers in a file, one per line, in ascending order using bounded memory.
+
+    Files with no more than run_size values are sorted in memory. Larger files are cut into
+    sorted runs of run_size values that are written next to the file and merged pairwise,
+    so memory use stays at about one run no matter how large the file is.
     
-    if len(target) <= 1:
-        return target
+    Args:
+        file_name (str): The file to sort.
+        run_size (int): Values sorted in memory at once. Defaults to 1,000,000.
     
-    mid_point = len(target) // 2
-    left = merge_sort(target[:mid_point])
-    right = merge_sort(target[mid_point:])
+    Yields:
+        int: The values in ascending order.
+    
+    Raises:
+        ValueError: If the file is not found.
+    '''
+    try:
+        file = open(file_name, 'r')
+    except FileNotFoundError as e:
+        raise ValueError(f"File not found: {file_name}") from e
 
-    return merge(left, right)
+    run_names = []
+    run = []
+    directory = os.path.dirname(os.path.abspath(file_name))
 
+    try:
+        with file:
+            for line in file:
+                line = line.strip()
+                if not line:
+                    continue
+                run.append(int(line))
+
+                if len(run) == run_size:
+                    run_names.append(os.path.join(directory, f'.{os.path.basename(file_name)}.run{len(run_names)}'))
+                    with open(run_names[-1], 'w') as run_file:
+                        run_file.writelines(f"{value}\n" for value in merge_sort(run))
+                    run = []
+
+        if not run_names:
+            yield from merge_sort(run)
+            return
+
+        if run:
+            run_names.append(os.path.join(directory, f'.{os.path.basename(file_name)}.run{len(run_names)}'))
+            with open(run_names[-1], 'w') as run_file:
+                run_file.writelines(f"{value}\n" for value in merge_sort(run))
+        run = []
+
+        # Merge runs in pairs until one is left
+        merges = 0
+        while len(run_names) > 1:
+            merged = []
+            for i in range(0, len(run_names) - 1, 2):
+                merged.append(os.path.join(directory, f'.{os.path.basename(file_name)}.merge{merges}'))
+                merges += 1
+                merge_files(run_names[i], run_names[i + 1], merged[-1])
+                os.remove(run_names[i])
+                os.remove(run_names[i + 1])
+            if len(run_names) % 2:
+                merged.append(run_names[-1])
+            run_names = merged
+
+        with open(run_names[0], 'r') as sorted_file:
+            for line in sorted_file:
+                yield int(line)
+
+    finally:
+        for name in run_names:
+            if os.path.exists(name):
+                os.remove(name)
 
 def find_in_sorted(search_pool: list, search_piece) -> int:
     '''Finds the index of a given element in a sorted list using binary search.
@@ -61,102 +431,96 @@ def find_in_sorted(search_pool: list, search_piece) -> int:
         search_piece: The element to find.
     
     Returns:
-        int: The index of the element in the list.
-    
-    Raises:
-        ValueError: If the element is not found.
+        int: The index of the element in the list, or None if it is not found.
     '''
-    def helper(low, high):
-        if low > high:
-            return None
-        
+    low = 0
+    high = len(search_pool) - 1
+
+    while low <= high:
         mid_point = (low + high) // 2
         mid_search = search_pool[mid_point]
-        
+
         if mid_search == search_piece:  # Found
             return mid_point
-        
+
         if mid_search > search_piece:  # Too high
-            return helper(low, mid_point - 1)
-        
-        # Too low
-        return helper(mid_point + 1, high)
+            high = mid_point - 1
+        else:  # Too low
+            low = mid_point + 1
 
-    return helper(0, len(search_pool) - 1)
+    return None
 
 def insert_into_sorted(sorted_list: list, item) -> list:
-    '''Inserts an item into a sorted list while maintaining sorted order.
+    '''Inserts an item into a sorted list in place while maintaining sorted order.
     
     Args:
         sorted_list (list): The sorted list to insert into.
         item: The item to insert.
     
     Returns:
-        list: A new sorted list with the item inserted.
+        list: The same list, with the item inserted.
     '''
-    def find_insert_position(low, high):
-        if low > high:
-            return low
+    low = 0
+    high = len(sorted_list)
 
+    while low < high:
         mid = (low + high) // 2
         if sorted_list[mid] < item:
-            return find_insert_position(mid + 1, high)
+            low = mid + 1
         else:
-            return find_insert_position(low, mid - 1)
+            high = mid
 
-    insert_position = find_insert_position(0, len(sorted_list) - 1)
-    return sorted_list[:insert_position] + [item] + sorted_list[insert_position:]
+    sorted_list.insert(low, item)
+    return sorted_list
 
 
-def populate_list(file_name: str = 'Collatz_Prefound.txt', destination: list = None) -> list:
+def populate_list(file_name: str = 'Collatz_Prefound.txt', destination: list | VerifiedSet = None, run_size: int = 1_000_000) -> list | VerifiedSet:
     '''Reads a file of values, sorts them, and populates a given list or returns a sorted list.
+
+    Values are sorted with sort_file(), so passing a VerifiedSet as the destination loads
+    files of any size in bounded memory.
     
     Args:
         file_name (str): The name of the file to read from. Defaults to 'Collatz_Prefound.txt'.
-        destination (list, optional): A list to populate with sorted values. If None, a new sorted list is returned.
+        destination (list | VerifiedSet, optional): A list or store to populate with sorted values. If None, a new sorted list is returned.
+        run_size (int): Values sorted in memory at once, see sort_file(). Defaults to 1,000,000.
     
     Returns:
-        list: The sorted list of values from the file.
+        list | VerifiedSet: The destination, populated with the sorted values from the file.
     
     Raises:
         ValueError: If the file is empty or cannot be read.
     '''
     if destination is None:
         destination = []
-    
-    try:
-        with open(file_name, 'r') as file:
-            lines = file.readlines()
-        
-        cleaned_lines = [int(line.strip()) for line in lines if line.strip()]
 
-        if not cleaned_lines:
-            raise ValueError(f"The file '{file_name}' is empty or has no valid content.")
+    count = 0
+    add = destination.add if isinstance(destination, VerifiedSet) else destination.append
+    for value in sort_file(file_name, run_size):
+        add(value)
+        count += 1
 
-        sorted_lines = merge_sort(cleaned_lines)
+    if not count:
+        raise ValueError(f"The file '{file_name}' is empty or has no valid content.")
 
-        destination.extend(sorted_lines)
-        return destination
+    return destination
 
-    except FileNotFoundError as e:
-        raise ValueError(f"File not found: {file_name}") from e
-
-def write_file(file_name: str = 'Collatz_Prefound.txt', source: list = None) -> None:
+def write_file(file_name: str = 'Collatz_Prefound.txt', source: list | VerifiedSet = None) -> None:
     '''Writes a list of unique values to a file.
     
     Args:
         file_name (str): The name of the file to write to. Defaults to 'Collatz_Prefound.txt'.
-        source (list, optional): The list of values to write to the file. Each value will be converted to a string.
+        source (list | VerifiedSet, optional): The values to write to the file. Each value will be converted to a string.
     
     Raises:
         ValueError: If the source is None or not iterable.
         IOError: If there are issues writing to the file.
     '''
-    if source is None or not isinstance(source, (list, tuple)):
-        raise ValueError("Source must be a non-empty list or tuple of values to write.")
+    if source is None or not isinstance(source, (list, tuple, VerifiedSet)):
+        raise ValueError("Source must be a non-empty list, tuple or VerifiedSet of values to write.")
 
     try:
-        unique_source = set(source)
+        unique_source = source.values() if isinstance(source, VerifiedSet) else set(source)
         with open(file_name, 'w') as file:
             for item in unique_source:
                 file.write(f"{str(item)}\n")
@@ -165,95 +529,332 @@ def write_file(file_name: str = 'Collatz_Prefound.txt', source: list = None) ->
         raise ValueError(f"Could not write to file: {file_name}") from e
 
 
-def check_collatz(number: int, sequence: list[int] = None) -> bool:
+def check_collatz(number: int, sequence: list[int] = None, sieve = None) -> bool:
     '''Checks if a number satisfies the Collatz Conjecture.
     
     Args:
         number (int): The starting number to check.
         sequence (list[int], optional): The sequence of numbers in the current Collatz path. Defaults to None.
+        sieve (SieveTable, optional): A table from sieve.load_sieve() used to skip k steps at a time. Defaults to None.
     
     Returns:
         bool: True if the Collatz Conjecture holds for the number, False if a loop is detected.
     '''
-    global SOLVED_LIST 
     if sequence is None:
         sequence = []
 
-    if find_in_sorted(SOLVED_LIST, number) or number == 1:
-        for item in sequence:
-            SOLVED_LIST = insert_into_sorted(SOLVED_LIST, item)  
+    tortoise = number
+    power = length = 1
+
+    while True:
+        if number in SOLVED or number == 1:
+            SOLVED.update(sequence)
+            return True
+
+        # Falling below itself only proves anything when everything below is verified
+        if sieve is not None and number - 1 <= SOLVED.watermark and sieve.descends(number):
+            SOLVED.update(sequence)
+            SOLVED.add(number)
+            return True
+
+        sequence.append(number)
+
+        if sieve is not None and number >= sieve.modulus:  # Smaller numbers could jump around the 1, 2 loop
+            number, _ = sieve.jump(number)
+        elif number % 2 == 0:  # Even
+            number //= 2
+        else:  # Odd
+            number = 3 * number + 1
+
+        # Brent's cycle detection: the tortoise jumps to the hare at every power of two
+        if number == tortoise:
+            return False
+        if power == length:
+            tortoise = number
+            power *= 2
+            length = 0
+        length += 1
+
+def verify_chunk(start: int, stop: int, max_steps: int = 100_000, sieve_k: int = None, collect: bool = False) -> dict:
+    '''Checks that every number in [start, stop) eventually falls below itself.
+
+    If every number below ``start`` is already verified, a number that falls below itself
+    is verified too, so a chunk can be checked without knowing anything about its neighbours.
+
+    With a sieve, numbers in residue classes that provably descend are skipped entirely and
+    are left out of the chunk's records, and numbers that stay above their start for k steps
+    jump straight past them. Stopping times stay exact, but values inside a jump are not
+    counted towards the peak excursion.
+    
+    Args:
+        start (int): First number of the chunk. Must be at least 2.
+        stop (int): One past the last number of the chunk.
+        max_steps (int): Steps allowed per number before it is reported as a failure. Defaults to 100,000.
+        sieve_k (int, optional): Low bits covered by the sieve table to memory-map, see sieve.load_sieve(). Defaults to no sieve.
+        collect (bool): Also gather records and histograms, including total stopping times, in a records.StatsCollector. Defaults to False.
+    
+    Returns:
+        dict: Results for the chunk with the following values:
+            'start'             : First number of the chunk (int)
+            'stop'              : One past the last number of the chunk (int)
+            'failed'            : First number that did not fall below itself within max_steps, or None (int | None)
+            'max_stopping_time' : Number with the most steps before falling below itself and its step count (tuple[int, int])
+            'max_excursion'     : Number with the highest value on its path and that value (tuple[int, int])
+            'stats'             : Only when collecting, the chunk's StatsCollector (StatsCollector)
+    
+    Raises:
+        ValueError: If the chunk starts below 2.
+    '''
+    if start < 2:
+        raise ValueError("Chunks must start at 2 or above")
+
+    result = {
+        'start': start,
+        'stop': stop,
+        'failed': None,
+        'max_stopping_time': (start, 0),
+        'max_excursion': (start, start),
+    }
+
+    sieve = None
+    if sieve_k is not None:
+        from sieve import load_sieve
+        sieve = load_sieve(k=sieve_k)
+
+    collector = None
+    if collect:
+        from records import StatsCollector
+        global ENGINE
+        if ENGINE is None:
+            ENGINE = StoppingTimes()
+        collector = result['stats'] = StatsCollector()
+
+    for number in range(start, stop):
+        value = number
+        peak = number
+        steps = 0
+
+        if sieve is not None:
+            if sieve.descends(number):
+                continue
+            if sieve.stays_above(number):
+                value, steps = sieve.jump(number)
+                peak = max(peak, value)
+
+        while value >= number:
+            if steps >= max_steps:
+                result['failed'] = number
+                result['stop'] = number
+                return result
+
+            if value % 2 == 0:  # Even
+                value //= 2
+            else:  # Odd
+                value = 3 * value + 1
+                if value > peak:
+                    peak = value
+            steps += 1
+
+        if steps > result['max_stopping_time'][1]:
+            result['max_stopping_time'] = (number, steps)
+        if peak > result['max_excursion'][1]:
+            result['max_excursion'] = (number, peak)
+
+        if collector is not None:
+            # Everything below the number is verified, so the rest of the path is memoized or short
+            collector.observe(number, steps, peak, steps + ENGINE.compute(value)[0])
+
+    return result
+
+def verify_range(start: int, stop: int, workers: int = None, chunk_size: int = 100_000, max_steps: int = 100_000, store: VerifiedSet = None, batched: bool = False, sieve_k: int = None, collector = None) -> dict:
+    '''Verifies every number in [start, stop) across a pool of processes.
+
+    The range is cut into chunks that are handed out a few at a time, so a worker that
+    finishes early simply picks up the next chunk. Finished chunks are merged into the
+    store's watermark in order as soon as every chunk before them is done.
+    
+    Args:
+        start (int): First number to verify. Must not leave a gap above the store's watermark.
+        stop (int): One past the last number to verify.
+        workers (int, optional): Number of worker processes. Defaults to the CPU count; 1 runs in this process.
+        chunk_size (int): Numbers per chunk. Defaults to 100,000.
+        max_steps (int): Steps allowed per number before it is reported as a failure. Defaults to 100,000.
+        store (VerifiedSet, optional): Store to merge results into. Defaults to SOLVED.
+        batched (bool): Check chunks with the NumPy kernel in vectorized.py. Defaults to False.
+        sieve_k (int, optional): Low bits covered by a sieve table each worker memory-maps to skip residue classes, see sieve.load_sieve(). Defaults to no sieve.
+        collector (StatsCollector, optional): A records.StatsCollector that every chunk's records and histograms are merged into, in range order. Defaults to None.
+    
+    Returns:
+        dict: Summary of the run with the following values:
+            'watermark' : The store's watermark after merging (int)
+            'failed'    : First number that could not be verified, or None (int | None)
+            'chunks'    : Results from verify_chunk() in range order (list[dict])
+    
+    Raises:
+        ValueError: If the range leaves a gap above the watermark or chunk_size is not positive.
+    '''
+    if store is None:
+        store = SOLVED
+
+    if chunk_size <= 0:
+        raise ValueError("Chunk size must be positive")
+
+    start = max(start, 2)
+    if start > store.watermark + 1:
+        raise ValueError(f"Range starting at {start:,} leaves a gap above the watermark {store.watermark:,}")
+
+    if sieve_k is not None:
+        from sieve import load_sieve
+        load_sieve(k=sieve_k)  # Build the table once up front rather than in every worker
+
+    if batched:
+        from vectorized import verify_chunk_batch as check_chunk
+    else:
+        check_chunk = verify_chunk
+
+    collect = collector is not None
+    workers = workers or os.cpu_count() or 1
+    bounds = [(low, min(low + chunk_size, stop)) for low in range(start, stop, chunk_size)]
+
+    chunks = []
+    pending = {}  # Finished chunks waiting on an earlier chunk, keyed by start
+    next_start = start
+    failed = None
+
+    def merge(result: dict) -> None:
+        nonlocal next_start, failed
+        chunks.append(result)
+        pending[result['start']] = result
+
+        # Only a contiguous run of finished chunks can move the watermark
+        while failed is None and next_start in pending:
+            done = pending.pop(next_start)
+            store.add_range(done['start'], done['stop'])
+            store.max_value = max(store.max_value, done['max_excursion'][1])  # Every value on a path is verified too
+            if collector is not None:
+                collector.merge(done.pop('stats'))
+            if done['failed'] is not None:
+                failed = done['failed']
+            next_start = done['stop']
+
+    if workers == 1:
+        for low, high in bounds:
+            merge(check_chunk(low, high, max_steps, sieve_k, collect))
+            if failed is not None:
+                break
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            queued = iter(bounds)
+            in_flight = set()
+
+            # Keep a few chunks per worker queued so nobody sits idle between results
+            for low, high in queued:
+                in_flight.add(executor.submit(check_chunk, low, high, max_steps, sieve_k, collect))
+                if len(in_flight) >= workers * 4:
+                    break
+
+            while in_flight:
+                done, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    merge(future.result())
+
+                if failed is None:
+                    for low, high in queued:
+                        in_flight.add(executor.submit(check_chunk, low, high, max_steps, sieve_k, collect))
+                        if len(in_flight) >= workers * 4:
+                            break
+
+    chunks.sort(key=lambda chunk: chunk['start'])
+
+    return {
+        'watermark': store.watermark,
+        'failed': failed,
+        'chunks': chunks,
+    }
+
+def load_progress(file_name: str = 'Collatz.ckpt', legacy_file: str = 'Collatz.txt') -> bool:
+    '''Loads saved progress into SOLVED.
+
+    Binary checkpoints are preferred. A text file from write_file() is only read when no
+    checkpoint exists yet, so old progress carries over once and is never re-sorted again.
+    
+    Args:
+        file_name (str): Checkpoint to resume from. Defaults to 'Collatz.ckpt'.
+        legacy_file (str): Text file to import when there is no checkpoint. Defaults to 'Collatz.txt'.
+    
+    Returns:
+        bool: True if any progress was loaded.
+    
+    Raises:
+        ValueError: If the checkpoint exists but is damaged.
+    '''
+    from checkpoint import load_checkpoint
+
+    if os.path.exists(file_name):
+        load_checkpoint(file_name, SOLVED)
         return True
 
-    if number in sequence:
+    try:
+        populate_list(legacy_file, SOLVED)
+        return True
+    except ValueError:
         return False
 
-    sequence.append(number)
-
-    if number % 2 == 0:  # Even
-        next_number = number // 2
-    else:  # Odd
-        next_number = 3 * number + 1
-
-    return check_collatz(next_number, sequence)
+def test(checkpoint_file: str = 'Collatz.ckpt', interval: float = 60.0):
+    '''Main function to test the Collatz Conjecture for sequential numbers.
+    
+    Args:
+        checkpoint_file (str): Checkpoint to resume from and save to. Defaults to 'Collatz.ckpt'.
+        interval (float): Seconds between background checkpoints. Defaults to 60.
+    '''
+    from checkpoint import CheckpointWriter
 
-def test():
-    '''Main function to test the Collatz Conjecture for sequential numbers.'''
-    global SOLVED_LIST  
+    if not load_progress(checkpoint_file):
+        print('Could not find file')
 
     result = True
-    try:
+    with CheckpointWriter(checkpoint_file, SOLVED, interval):
         try:
-            populate_list('Collatz.txt', SOLVED_LIST)
-        except ValueError: 
-            print('Could not find file')
-
-        number = 1
-        while number in SOLVED_LIST and number + 1 in SOLVED_LIST:
-            number += 1
-
-        while result:
-            number += 1
-            result = check_collatz(number)
-            if result:
-                print(f"{number:,} passes the test.")
-                if not find_in_sorted(SOLVED_LIST, number):
-                    SOLVED_LIST = insert_into_sorted(SOLVED_LIST, number)
-
-        print(f"{number} disproves the Collatz Conjecture!")
-
-    except ValueError as e:
-        print(f"Error occurred: {e}. Saving progress...")
-        write_file('Collatz.txt', SOLVED_LIST)
-        print("Progress saved. Exiting.")
-
-    except Exception as e:
-        print(f"Unexpected error: {e}. Saving progress...")
-        write_file('Collatz.txt', SOLVED_LIST)
-        print("Progress saved. Exiting.")
-
-    except KeyboardInterrupt:
-        print("\nOperation interrupted by user. Saving progress...")
-        write_file('Collatz.txt', SOLVED_LIST)
-        print("Progress saved. Exiting.")
-
-def stats():
-    global SOLVED_LIST
+            number = SOLVED.watermark
 
-    try:
-        populate_list('Collatz.txt', SOLVED_LIST)
-    except ValueError:
-        print('Could not find or read the file properly.')
+            while result:
+                number += 1
+                result = check_collatz(number)
+                if result:
+                    print(f"{number:,} passes the test.")
+                    SOLVED.add(number)
+
+            print(f"{number} disproves the Collatz Conjecture!")
+
+        except ValueError as e:
+            print(f"Error occurred: {e}. Saving progress...")
 
-    if not SOLVED_LIST:
-        print("No data loaded into SOLVED_LIST. Exiting statistics computation.")
+        except Exception as e:
+            print(f"Unexpected error: {e}. Saving progress...")
+
+        except KeyboardInterrupt:
+            print("\nOperation interrupted by user. Saving progress...")
+
+    print("Progress saved. Exiting.")
+
+def stats(checkpoint_file: str = 'Collatz.ckpt'):
+    from checkpoint import load_checkpoint
+
+    summary = {}
+    if os.path.exists(checkpoint_file):
+        summary = load_checkpoint(checkpoint_file, SOLVED)
+    elif not load_progress(checkpoint_file):
+        print('Could not find or read the file properly.')
+        print("No data loaded into SOLVED. Exiting statistics computation.")
         return
 
-    number = 1
-    while number in SOLVED_LIST and number + 1 in SOLVED_LIST:
-        number += 1
+    print(f"Tested values up to {SOLVED.watermark:,}.")
+    print(f"Maximum value is {SOLVED.max_value:,}")
 
-    print(f"Tested values up to {number:,}.")
-    print(f"Maximum value is {max(SOLVED_LIST):,}")
+    for key, label in (('glide_record', 'Longest glide'), ('delay_record', 'Longest total stopping time'), ('path_record', 'Highest peak')):
+        if summary.get(key):
+            number, value = summary[key]
+            print(f"{label} is {value:,} from {number:,}")
 
 if __name__ == '__main__':
     method = 'test'
@@ -262,4 +863,22 @@ if __name__ == '__main__':
         test()
 
     if method == 'stats':
-        stats()
\ No newline at end of file
+        stats()
+
+    if method == 'verify':
+        from checkpoint import CheckpointWriter, load_checkpoint
+        from records import StatsCollector
+
+        saved = {}
+        if os.path.exists('Collatz.ckpt'):
+            saved = load_checkpoint('Collatz.ckpt', SOLVED)
+        else:
+            load_progress()
+        collector = StatsCollector.from_summary(saved)
+        with CheckpointWriter('Collatz.ckpt', SOLVED, summary=collector.summary):
+            summary = verify_range(SOLVED.watermark + 1, SOLVED.watermark + 10**8, chunk_size=10**6, batched=True, sieve_k=20, collector=collector)
+            for chunk in summary['chunks']:
+                print(f"{chunk['start']:,} to {chunk['stop']:,}: longest stopping time {chunk['max_stopping_time'][1]} ({chunk['max_stopping_time'][0]:,}), "
+                      f"highest excursion {chunk['max_excursion'][1]:,} ({chunk['max_excursion'][0]:,})")
+            print(f"Verified up to {summary['watermark']:,}")
+        collector.write_columns('Collatz_Stats')
\ No newline at end of file
@@ -0,0 +1,150 @@
+'''Benchmarks the iterative sorting and searching helpers in Collatz.py against the original recursive ones'''
+
+import os, random, sys, tempfile
+from time import perf_counter
+
+from Collatz import merge_sort, find_in_sorted, insert_into_sorted, sort_file
+
+
+def legacy_merge_sort(target: list) -> list:
+    '''Original recursive version, kept for comparison.'''
+    def merge(left: list, right: list) -> list:
+        '''Merges two sorted lists into a single sorted list.
+        
+        Args:
+            left (list): A sorted list.
+            right (list): Another sorted list.
+        
+        Returns:
+            list: A merged sorted list.
+        '''
+        result = []
+        i = j = 0
+        
+        while i < len(left) and j < len(right):
+            if left[i] < right[j]:
+                result.append(left[i])
+                i += 1
+            else:
+                result.append(right[j])
+                j += 1
+        
+        result.extend(left[i:])
+        result.extend(right[j:])
+        
+        return result
+
+    if target is None:
+        raise ValueError("List to sort must not be None")
+    
+    if len(target) <= 1:
+        return target
+    
+    mid_point = len(target) // 2
+    left = legacy_merge_sort(target[:mid_point])
+    right = legacy_merge_sort(target[mid_point:])
+
+    return merge(left, right)
+
+
+def legacy_find_in_sorted(search_pool: list, search_piece) -> int:
+    '''Original recursive version, kept for comparison.'''
+    def helper(low, high):
+        if low > high:
+            return None
+        
+        mid_point = (low + high) // 2
+        mid_search = search_pool[mid_point]
+        
+        if mid_search == search_piece:  # Found
+            return mid_point
+        
+        if mid_search > search_piece:  # Too high
+            return helper(low, mid_point - 1)
+        
+        # Too low
+        return helper(mid_point + 1, high)
+
+    return helper(0, len(search_pool) - 1)
+
+def legacy_insert_into_sorted(sorted_list: list, item) -> list:
+    '''Original recursive version, kept for comparison.'''
+    def find_insert_position(low, high):
+        if low > high:
+            return low
+
+        mid = (low + high) // 2
+        if sorted_list[mid] < item:
+            return find_insert_position(mid + 1, high)
+        else:
+            return find_insert_position(low, mid - 1)
+
+    insert_position = find_insert_position(0, len(sorted_list) - 1)
+    return sorted_list[:insert_position] + [item] + sorted_list[insert_position:]
+
+
+def time_call(function, *args) -> float:
+    '''Runs a function once and returns how long it took in seconds.'''
+    start = perf_counter()
+    function(*args)
+    return perf_counter() - start
+
+def report(name: str, legacy_time: float, new_time: float) -> None:
+    print(f"{name:<40}{legacy_time:>12.4f}s{new_time:>12.4f}s{legacy_time / new_time:>10.1f}x")
+
+def benchmark(size: int = 200_000, lookups: int = 100_000, inserts: int = 1_000, file_size: int = 2_000_000, run_size: int = 250_000, seed: int = 0) -> None:
+    '''Times both versions of each helper and prints a comparison table.
+
+    Args:
+        size (int): Values to sort and search. Defaults to 200,000.
+        lookups (int): Binary searches to time. Defaults to 100,000.
+        inserts (int): Sorted inserts to time. Defaults to 1,000.
+        file_size (int): Values in the file for the external sort. Defaults to 2,000,000.
+        run_size (int): Values per run for the external sort. Defaults to 250,000.
+        seed (int): Seed for the random data. Defaults to 0.
+    '''
+    rng = random.Random(seed)
+    values = [rng.randrange(10 * size) for _ in range(size)]
+
+    print(f"{'':<40}{'Original':>13}{'Iterative':>13}{'Speedup':>11}")
+
+    legacy_sorted = legacy_merge_sort(values)
+    new_sorted = merge_sort(values)
+    assert legacy_sorted == new_sorted
+    report(f"merge_sort ({size:,} values)", time_call(legacy_merge_sort, values), time_call(merge_sort, values))
+
+    targets = [rng.randrange(10 * size) for _ in range(lookups)]
+    def search_all(search):
+        for target in targets:
+            search(new_sorted, target)
+    report(f"find_in_sorted ({lookups:,} lookups)", time_call(search_all, legacy_find_in_sorted), time_call(search_all, find_in_sorted))
+
+    items = [rng.randrange(10 * size) for _ in range(inserts)]
+    def insert_legacy():
+        sorted_list = list(new_sorted)
+        for item in items:
+            sorted_list = legacy_insert_into_sorted(sorted_list, item)
+    def insert_new():
+        sorted_list = list(new_sorted)
+        for item in items:
+            insert_into_sorted(sorted_list, item)
+    report(f"insert_into_sorted ({inserts:,} inserts)", time_call(insert_legacy), time_call(insert_new))
+
+    # The original has no external sort, so compare against reading the whole file into memory
+    with tempfile.TemporaryDirectory() as directory:
+        file_name = os.path.join(directory, 'values.txt')
+        with open(file_name, 'w') as file:
+            file.writelines(f"{rng.randrange(10 * file_size)}\n" for _ in range(file_size))
+
+        def sort_in_memory():
+            with open(file_name, 'r') as file:
+                legacy_merge_sort([int(line) for line in file])
+        def sort_external():
+            for _ in sort_file(file_name, run_size):
+                pass
+        report(f"file sort ({file_size:,} values)", time_call(sort_in_memory), time_call(sort_external))
+
+
+if __name__ == '__main__':
+    sys.setrecursionlimit(10_000)
+    benchmark()
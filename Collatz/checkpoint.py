@@ -0,0 +1,140 @@
+'''Crash-safe binary checkpoints of Collatz progress'''
+
+import json, mmap, os, struct, threading, zlib
+
+MAGIC = b'CLZCKPT\x00'
+VERSION = 1
+HEADER = struct.Struct('<8sIIQQQI')  # Magic, version, CRC-32 of the body, watermark, base, bit array length, summary length
+
+
+def save_checkpoint(file_name: str, store, summary: dict = None) -> None:
+    '''Writes a store's progress to a binary checkpoint.
+
+    The file is a fixed header followed by the store's bit array and a JSON stats summary,
+    with a CRC-32 over both. It is written to a temporary file, flushed to disk and then
+    renamed over the old checkpoint, so a crash at any point leaves a valid checkpoint behind.
+
+    Args:
+        file_name (str): Path of the checkpoint.
+        store (VerifiedSet): The store to save. Only snapshot() is used, so this is safe from a background thread.
+        summary (dict, optional): Extra JSON-serializable stats to keep with the checkpoint. Defaults to None.
+
+    Raises:
+        ValueError: If the checkpoint could not be written.
+    '''
+    watermark, base, bits, max_value = store.snapshot()
+    summary_bytes = json.dumps({**(summary or {}), 'max_value': max_value}).encode('utf-8')
+
+    checksum = zlib.crc32(summary_bytes, zlib.crc32(bits))
+    header = HEADER.pack(MAGIC, VERSION, checksum, watermark, base, len(bits), len(summary_bytes))
+
+    temp_name = f"{file_name}.tmp"
+    try:
+        with open(temp_name, 'wb') as file:
+            file.write(header)
+            file.write(bits)
+            file.write(summary_bytes)
+            file.flush()
+            os.fsync(file.fileno())
+
+        os.replace(temp_name, file_name)
+
+    except OSError as e:
+        raise ValueError(f"Could not write checkpoint: {file_name}") from e
+
+def load_checkpoint(file_name: str, store) -> dict:
+    '''Restores a store from a checkpoint written by save_checkpoint().
+
+    Args:
+        file_name (str): Path of the checkpoint.
+        store (VerifiedSet): The store to restore into.
+
+    Returns:
+        dict: The stats summary saved with the checkpoint.
+
+    Raises:
+        ValueError: If the file is missing, is not a checkpoint, or fails its checksum.
+    '''
+    try:
+        with open(file_name, 'rb') as file:
+            source = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+    except (OSError, ValueError) as e:  # mmap raises ValueError on empty files
+        raise ValueError(f"Could not read checkpoint: {file_name}") from e
+
+    with source:
+        if len(source) < HEADER.size:
+            raise ValueError(f"'{file_name}' is not a checkpoint")
+
+        magic, version, checksum, watermark, base, bits_length, summary_length = HEADER.unpack_from(source)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"'{file_name}' is not a version {VERSION} checkpoint")
+        if len(source) != HEADER.size + bits_length + summary_length:
+            raise ValueError(f"'{file_name}' is truncated")
+
+        # Copy out of the map so no views are left open when it closes
+        with memoryview(source) as view:
+            if zlib.crc32(view[HEADER.size:]) != checksum:
+                raise ValueError(f"'{file_name}' failed its checksum")
+
+            bits = bytes(view[HEADER.size:HEADER.size + bits_length])
+            summary = json.loads(bytes(view[HEADER.size + bits_length:]))
+
+    store.restore(watermark, base, bits, summary.get('max_value', watermark))
+
+    return summary
+
+
+class CheckpointWriter:
+    '''Saves checkpoints from a background thread at a regular interval.
+
+    Used as a context manager, a final checkpoint is written on exit no matter how the
+    block ends.
+
+    Args:
+        file_name (str): Path of the checkpoint.
+        store (VerifiedSet): The store to save.
+        interval (float): Seconds between checkpoints. Defaults to 60.
+        summary (callable, optional): Called before every save for extra stats to keep with the checkpoint. Defaults to None.
+    '''
+
+    def __init__(self, file_name: str, store, interval: float = 60.0, summary = None):
+        self.file_name = file_name
+        self.store = store
+        self.interval = interval
+        self.summary = summary
+        self._stop = threading.Event()
+        self._lock = threading.Lock()  # Keeps the final save from racing a background one
+        self._thread = None
+
+    def save(self) -> None:
+        '''Writes a checkpoint now.'''
+        with self._lock:
+            save_checkpoint(self.file_name, self.store, self.summary() if self.summary else None)
+
+    def start(self) -> None:
+        '''Starts saving in the background.'''
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name='CheckpointWriter', daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        '''Stops the background thread and writes a final checkpoint.'''
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        self.save()
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            try:
+                self.save()
+            except ValueError as e:
+                print(f"Checkpoint failed: {e}")
+
+    def __enter__(self) -> 'CheckpointWriter':
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
@@ -0,0 +1,194 @@
+'''Streaming Collatz statistics: record holders and histograms gathered while verifying'''
+
+import json, os, sys
+from array import array
+
+
+def _grow_add(histogram: array, index: int, amount: int = 1) -> None:
+    if index >= len(histogram):
+        histogram.frombytes(bytes(8 * (index + 1 - len(histogram))))  # Zeroed uint64 slots
+    histogram[index] += amount
+
+
+class StatsCollector:
+    '''Collects record holders and histograms one number at a time, with no second pass.
+
+    Numbers must be observed in ascending order. Collectors for separate ranges can be
+    built in parallel and merged afterwards, as long as they are merged in range order.
+
+    Following the usual naming, the glide of a number is the steps it takes to fall below
+    itself, its delay is the steps it takes to reach 1 (the total stopping time), and its
+    peak is the highest value on its path. A record holder beats every smaller number.
+
+    Attributes:
+        count (int): Numbers observed.
+        glide_records (list[tuple[int, int]]): Numbers that set a glide record and their glide.
+        delay_records (list[tuple[int, int]]): Numbers that set a delay record and their delay.
+        path_records (list[tuple[int, int]]): Numbers that set a peak record and their peak.
+        glide_histogram (array): Count of numbers with each glide (uint64, indexed by glide).
+        delay_histogram (array): Count of numbers with each delay (uint64, indexed by delay).
+    '''
+
+    def __init__(self):
+        self.count = 0
+        self.glide_records = []
+        self.delay_records = []
+        self.path_records = []
+        self.glide_histogram = array('Q')
+        self.delay_histogram = array('Q')
+
+    @classmethod
+    def from_summary(cls, summary: dict) -> 'StatsCollector':
+        '''Picks up from a summary() saved in a checkpoint, so records carry across restarts.
+
+        Histograms are not part of the summary and start empty.
+
+        Args:
+            summary (dict): A summary from summary(). Missing keys are fine.
+
+        Returns:
+            StatsCollector: A collector whose next records must beat the saved ones.
+        '''
+        collector = cls()
+        collector.count = summary.get('observed', 0)
+        for key, records in (('glide_record', collector.glide_records), ('delay_record', collector.delay_records), ('path_record', collector.path_records)):
+            if summary.get(key):
+                records.append(tuple(summary[key]))
+        return collector
+
+    def observe(self, number: int, glide: int, peak: int, delay: int = None) -> None:
+        '''Adds one number's results.
+
+        Args:
+            number (int): The number. Must be larger than every number observed before.
+            glide (int): Steps until it fell below itself.
+            peak (int): Highest value on its path.
+            delay (int, optional): Steps until it reached 1, if known. Defaults to None.
+        '''
+        self.count += 1
+        _grow_add(self.glide_histogram, glide)
+
+        if not self.glide_records or glide > self.glide_records[-1][1]:
+            self.glide_records.append((number, glide))
+        if not self.path_records or peak > self.path_records[-1][1]:
+            self.path_records.append((number, peak))
+
+        if delay is not None:
+            _grow_add(self.delay_histogram, delay)
+            if not self.delay_records or delay > self.delay_records[-1][1]:
+                self.delay_records.append((number, delay))
+
+    def merge(self, other: 'StatsCollector') -> None:
+        '''Folds in a collector for a range that comes after everything observed so far.
+
+        A record holder overall must also be one within its own range, so only the other
+        collector's records need checking.
+
+        Args:
+            other (StatsCollector): Collector for the next range.
+        '''
+        self.count += other.count
+
+        for mine, theirs in ((self.glide_records, other.glide_records), (self.delay_records, other.delay_records), (self.path_records, other.path_records)):
+            for number, value in theirs:
+                if not mine or value > mine[-1][1]:
+                    mine.append((number, value))
+
+        for mine, theirs in ((self.glide_histogram, other.glide_histogram), (self.delay_histogram, other.delay_histogram)):
+            for index, amount in enumerate(theirs):
+                if amount:
+                    _grow_add(mine, index, amount)
+
+    def summary(self) -> dict:
+        '''Current record holders, small enough to keep in a checkpoint.
+
+        Returns:
+            dict: The latest record holder of each kind as [number, value], or None, and the count.
+        '''
+        return {
+            'observed': self.count,
+            'glide_record': list(self.glide_records[-1]) if self.glide_records else None,
+            'delay_record': list(self.delay_records[-1]) if self.delay_records else None,
+            'path_record': list(self.path_records[-1]) if self.path_records else None,
+        }
+
+    def write_columns(self, directory: str) -> None:
+        '''Writes every record list and histogram as column files for later analysis.
+
+        Each column is its own file of little-endian uint64 values (values too large for
+        uint64 make the whole column fall back to one decimal number per line), described
+        by a manifest.json so it can be read back with read_columns() or numpy.fromfile().
+
+        Args:
+            directory (str): Directory to write to. Created if needed.
+
+        Raises:
+            ValueError: If the columns could not be written.
+        '''
+        columns = {}
+        for name, records in (('glide_records', self.glide_records), ('delay_records', self.delay_records), ('path_records', self.path_records)):
+            columns[f'{name}.number'] = [number for number, _ in records]
+            columns[f'{name}.value'] = [value for _, value in records]
+        columns['glide_histogram'] = self.glide_histogram
+        columns['delay_histogram'] = self.delay_histogram
+
+        manifest = {'observed': self.count, 'columns': {}}
+        try:
+            os.makedirs(directory, exist_ok=True)
+
+            for name, values in columns.items():
+                try:
+                    data = array('Q', values)
+                    if sys.byteorder == 'big':  # Keep files little-endian everywhere
+                        data.byteswap()
+                    file_name = f'{name}.u64'
+                    with open(os.path.join(directory, file_name), 'wb') as file:
+                        data.tofile(file)
+                    manifest['columns'][name] = {'file': file_name, 'format': 'uint64', 'length': len(data)}
+                except OverflowError:
+                    file_name = f'{name}.txt'
+                    with open(os.path.join(directory, file_name), 'w') as file:
+                        file.writelines(f"{value}\n" for value in values)
+                    manifest['columns'][name] = {'file': file_name, 'format': 'text', 'length': len(values)}
+
+            with open(os.path.join(directory, 'manifest.json'), 'w') as file:
+                json.dump(manifest, file, indent=4)
+
+        except OSError as e:
+            raise ValueError(f"Could not write statistics to: {directory}") from e
+
+
+def read_columns(directory: str) -> dict:
+    '''Reads columns written by StatsCollector.write_columns().
+
+    Args:
+        directory (str): Directory the columns were written to.
+
+    Returns:
+        dict: Column name to list of values, plus 'observed' for the number count.
+
+    Raises:
+        ValueError: If the directory has no manifest or a column is missing.
+    '''
+    try:
+        with open(os.path.join(directory, 'manifest.json'), 'r') as file:
+            manifest = json.load(file)
+
+        data = {'observed': manifest['observed']}
+        for name, column in manifest['columns'].items():
+            path = os.path.join(directory, column['file'])
+            if column['format'] == 'uint64':
+                values = array('Q')
+                with open(path, 'rb') as file:
+                    values.fromfile(file, column['length'])
+                if sys.byteorder == 'big':
+                    values.byteswap()
+                data[name] = values.tolist()
+            else:
+                with open(path, 'r') as file:
+                    data[name] = [int(line) for line in file if line.strip()]
+
+        return data
+
+    except (OSError, KeyError, EOFError, json.JSONDecodeError) as e:
+        raise ValueError(f"Could not read statistics from: {directory}") from e
@@ -0,0 +1,186 @@
+'''Precomputed 2^k sieve for skipping k Collatz steps at once'''
+
+import mmap, os, struct
+
+MAGIC = b'CLZSIEVE'
+VERSION = 1
+HEADER = struct.Struct('<8sII')  # Magic, version, k; 16 bytes keeps the tables 8-byte aligned
+
+# Residue class flags
+SURVIVES = 0   # Might not descend within k steps, but may dip below its start on the way
+STAYS_ABOVE = 1  # Stays above its start for all k steps, so jumping keeps stopping times exact
+DESCENDS = 2   # Every member of 2^k or more provably falls below itself within k steps
+
+_LOADED = {}  # Tables already mapped by this process, keyed by path
+
+
+class SieveTable:
+    '''Lookup table of k-step Collatz jumps over the residues mod 2^k.
+
+    Using the (3n + 1) / 2 shortcut, the first k steps of n = a * 2^k + r only depend on r,
+    so after k steps n lands on a * 3^c + d, where c is the number of odd steps and d is
+    where r itself lands. A whole residue class can be removed when every member of 2^k or
+    more provably falls below its start within those k steps.
+
+    Args:
+        k (int): Number of low bits the table covers.
+        landings (memoryview): Where each residue lands after k shortcut steps (uint64).
+        odd_steps (memoryview): Number of odd steps taken by each residue (uint8).
+        flags (memoryview): SURVIVES, STAYS_ABOVE or DESCENDS for each residue (uint8).
+        source (mmap.mmap, optional): Memory map backing the views, kept open while the table is in use.
+    '''
+
+    def __init__(self, k: int, landings, odd_steps, flags, source: mmap.mmap = None):
+        self.k = k
+        self.modulus = 1 << k
+        self.mask = self.modulus - 1
+        self.landings = landings
+        self.odd_steps = odd_steps
+        self.flags = flags
+        self._source = source
+
+    @classmethod
+    def build(cls, k: int = 16) -> 'SieveTable':
+        '''Computes the table for a given k.
+
+        Args:
+            k (int): Number of low bits to cover, from 1 to 32. Defaults to 16.
+
+        Returns:
+            SieveTable: The in-memory table.
+
+        Raises:
+            ValueError: If k is out of range.
+        '''
+        if not 1 <= k <= 32:
+            raise ValueError("k must be between 1 and 32")
+
+        modulus = 1 << k
+        landings = memoryview(bytearray(8 * modulus)).cast('Q')
+        odd_steps = bytearray(modulus)
+        flags = bytearray(modulus)
+
+        for residue in range(modulus):
+            value = residue
+            odd = 0
+            power = 1  # 3 ** odd
+            stays_above = True
+            descends = False
+
+            for step in range(1, k + 1):
+                if value % 2 == 0:  # Even
+                    value //= 2
+                else:  # Odd, using the (3n + 1) / 2 shortcut
+                    value = (3 * value + 1) // 2
+                    odd += 1
+                    power *= 3
+
+                if power < 1 << step:
+                    stays_above = False
+                    # Below this point a larger multiple of 2^k only lands further under its start,
+                    # so checking the smallest member of 2^k or more covers the whole class
+                    if not descends and (power << (k - step)) + value < modulus + residue:
+                        descends = True
+
+            landings[residue] = value
+            odd_steps[residue] = odd
+            flags[residue] = DESCENDS if descends else STAYS_ABOVE if stays_above else SURVIVES
+
+        return cls(k, landings, memoryview(odd_steps), memoryview(flags))
+
+    @classmethod
+    def load(cls, file_name: str) -> 'SieveTable':
+        '''Memory-maps a table written by save().
+
+        Args:
+            file_name (str): Path of the table file.
+
+        Returns:
+            SieveTable: A table backed by the file.
+
+        Raises:
+            ValueError: If the file is not a sieve table or is truncated.
+        '''
+        with open(file_name, 'rb') as file:
+            source = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        if len(source) < HEADER.size:
+            raise ValueError(f"'{file_name}' is not a sieve table")
+
+        magic, version, k = HEADER.unpack_from(source)
+        modulus = 1 << k
+        if magic != MAGIC or version != VERSION or len(source) != HEADER.size + 10 * modulus:
+            raise ValueError(f"'{file_name}' is not a version {VERSION} sieve table")
+
+        view = memoryview(source)
+        landings_end = HEADER.size + 8 * modulus
+        landings = view[HEADER.size:landings_end].cast('Q')
+        odd_steps = view[landings_end:landings_end + modulus]
+        flags = view[landings_end + modulus:]
+
+        return cls(k, landings, odd_steps, flags, source)
+
+    def save(self, file_name: str) -> None:
+        '''Writes the table to disk so later runs can memory-map it.
+
+        Args:
+            file_name (str): Path to write to. Replaced atomically.
+        '''
+        temp_name = f"{file_name}.tmp"
+        with open(temp_name, 'wb') as file:
+            file.write(HEADER.pack(MAGIC, VERSION, self.k))
+            file.write(self.landings.cast('B'))
+            file.write(self.odd_steps)
+            file.write(self.flags)
+
+        os.replace(temp_name, file_name)
+
+    def descends(self, number: int) -> bool:
+        '''Checks whether a number provably falls below itself within k steps.'''
+        return number >= self.modulus and self.flags[number & self.mask] == DESCENDS
+
+    def stays_above(self, number: int) -> bool:
+        '''Checks whether a number stays above itself for its first k steps.'''
+        return number >= self.modulus and self.flags[number & self.mask] == STAYS_ABOVE
+
+    def jump(self, number: int) -> tuple[int, int]:
+        '''Takes k shortcut steps at once.
+
+        Args:
+            number (int): Any positive number.
+
+        Returns:
+            tuple[int, int]: The value after k shortcut steps and how many standard (3n + 1 and n / 2) steps that is.
+        '''
+        residue = number & self.mask
+        odd = self.odd_steps[residue]
+        return (number >> self.k) * 3**odd + self.landings[residue], self.k + odd
+
+
+def load_sieve(file_name: str = None, k: int = 16) -> SieveTable:
+    '''Memory-maps a sieve table, building and saving it first if it does not exist yet.
+
+    Tables are mapped once per process, so this is cheap to call from every worker.
+
+    Args:
+        file_name (str, optional): Path of the table file. Defaults to 'Collatz_Sieve_{k}.bin'.
+        k (int): Number of low bits the table covers. Defaults to 16.
+
+    Returns:
+        SieveTable: The mapped table.
+
+    Raises:
+        ValueError: If an existing file covers a different k.
+    '''
+    if file_name is None:
+        file_name = f'Collatz_Sieve_{k}.bin'
+
+    if file_name not in _LOADED:
+        if not os.path.exists(file_name):
+            SieveTable.build(k).save(file_name)
+        _LOADED[file_name] = SieveTable.load(file_name)
+
+    if _LOADED[file_name].k != k:
+        raise ValueError(f"'{file_name}' covers k={_LOADED[file_name].k}, not k={k}")
+
+    return _LOADED[file_name]
@@ -0,0 +1,212 @@
+'''Batched Collatz stepping with NumPy, for verifying many starting values at once'''
+
+from array import array
+
+import numpy as np
+
+_ONE = np.uint64(1)
+_THREE = np.uint64(3)
+_OVERFLOW_LIMIT = np.uint64((2**64 - 2) // 3)  # Largest value whose 3n + 1 still fits in a uint64
+
+
+def _descend_exact(number: int, value: int, steps: int, peak: int, max_steps: int) -> tuple[int, int] | None:
+    '''Finishes a descent with Python integers once a value has outgrown uint64.
+
+    Args:
+        number (int): The starting number.
+        value (int): Current value on the path.
+        steps (int): Steps already taken.
+        peak (int): Highest value seen so far.
+        max_steps (int): Steps allowed before giving up.
+
+    Returns:
+        tuple[int, int] | None: The stopping time and peak, or None if max_steps ran out.
+    '''
+    while value >= number:
+        if steps >= max_steps:
+            return None
+
+        if value % 2 == 0:  # Even
+            value //= 2
+            steps += 1
+        else:  # Odd, using the (3n + 1) / 2 shortcut
+            value = 3 * value + 1
+            if value > peak:
+                peak = value
+            value //= 2
+            steps += 2
+
+    return steps, peak
+
+def descend_batch(numbers, max_steps: int = 100_000) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    '''Advances a whole array of starting numbers until each falls below itself.
+
+    Every step updates the even and odd members of the batch with masks, using the
+    (3n + 1) / 2 shortcut for odd members. A member leaves the batch as soon as it
+    falls below its starting number. Members whose next odd step would overflow a
+    uint64 are handed to an arbitrary-precision path instead.
+
+    Args:
+        numbers: Array-like of starting numbers, all at least 2.
+        max_steps (int): Steps allowed per number before it counts as a failure. Defaults to 100,000.
+
+    Returns:
+        tuple[np.ndarray, np.ndarray, np.ndarray]:
+            Stopping time of each number in standard (3n + 1 and n / 2) steps, -1 for failures (int64)
+            Highest value on each path, 0 where it does not fit in a uint64 (uint64)
+            Highest value on each path as Python integers, for members that overflowed (object)
+
+    Raises:
+        ValueError: If any starting number is below 2.
+    '''
+    starts = np.asarray(numbers, dtype=np.uint64)
+    if starts.size and starts.min() < 2:
+        raise ValueError("Starting numbers must be at least 2")
+
+    stopping_times = np.full(starts.shape, -1, dtype=np.int64)
+    peaks = np.zeros(starts.shape, dtype=np.uint64)
+    big_peaks = np.zeros(starts.shape, dtype=object)
+
+    # Compact working arrays for the members still in the batch
+    index = np.arange(starts.size)
+    start = starts.copy()
+    value = starts.copy()
+    peak = starts.copy()
+    steps = np.zeros(starts.size, dtype=np.int64)
+
+    while index.size:
+        odd = (value & _ONE).astype(bool)
+
+        overflow = odd & (value > _OVERFLOW_LIMIT)
+        if overflow.any():
+            for i, v, s, p in zip(index[overflow], value[overflow], steps[overflow], peak[overflow]):
+                result = _descend_exact(int(starts[i]), int(v), int(s), int(p), max_steps)
+                if result is not None:
+                    stopping_times[i], big_peaks[i] = result
+
+            keep = ~overflow
+            index, start, value, peak, steps, odd = index[keep], start[keep], value[keep], peak[keep], steps[keep], odd[keep]
+
+        tripled = value[odd] * _THREE + _ONE
+        peak[odd] = np.maximum(peak[odd], tripled)
+        value[odd] = tripled
+        value >>= _ONE
+        steps += 1 + odd
+
+        done = value < start
+        if done.any():
+            stopping_times[index[done]] = steps[done]
+            peaks[index[done]] = peak[done]
+
+        # Members past max_steps keep the -1 stopping time and drop out with the finished ones
+        keep = ~done & (steps < max_steps)
+        index, start, value, peak, steps = index[keep], start[keep], value[keep], peak[keep], steps[keep]
+
+    return stopping_times, peaks, big_peaks
+
+def _collect_batch(collector, numbers: np.ndarray, stopping_times: np.ndarray, peaks: np.ndarray, big_peaks: np.ndarray) -> None:
+    '''Folds a finished batch into a records.StatsCollector without visiting every number in Python.'''
+    from records import StatsCollector
+
+    batch = StatsCollector()
+    batch.count = int(numbers.size)
+    batch.glide_histogram = array('Q', np.bincount(stopping_times).tolist())
+
+    # Only numbers that beat everything earlier in the batch can be records at all
+    for values, records, exact in ((stopping_times, batch.glide_records, None), (peaks, batch.path_records, big_peaks)):
+        earlier = np.maximum.accumulate(values)
+        candidates = np.ones(values.size, dtype=bool)
+        candidates[1:] = values[1:] > earlier[:-1]
+        if exact is not None:
+            candidates |= exact.astype(bool)
+
+        for i in np.flatnonzero(candidates):
+            value = int(exact[i]) if exact is not None and exact[i] else int(values[i])
+            if not records or value > records[-1][1]:
+                records.append((int(numbers[i]), value))
+
+    collector.merge(batch)
+
+def verify_chunk_batch(start: int, stop: int, max_steps: int = 100_000, sieve_k: int = None, collect: bool = False, batch_size: int = 1 << 20) -> dict:
+    '''Batched drop-in for Collatz.verify_chunk().
+
+    With a sieve, numbers in residue classes that provably descend are removed before the
+    batch starts stepping and are left out of the chunk's records. When collecting, glide
+    and peak records and the glide histogram are gathered, but total stopping times are not.
+
+    Args:
+        start (int): First number of the chunk. Must be at least 2.
+        stop (int): One past the last number of the chunk.
+        max_steps (int): Steps allowed per number before it is reported as a failure. Defaults to 100,000.
+        sieve_k (int, optional): Low bits covered by the sieve table to memory-map, see sieve.load_sieve(). Defaults to no sieve.
+        collect (bool): Also gather records and a histogram in a records.StatsCollector. Defaults to False.
+        batch_size (int): Numbers advanced together per call to descend_batch(). Defaults to 2**20.
+
+    Returns:
+        dict: The same values as Collatz.verify_chunk().
+
+    Raises:
+        ValueError: If the chunk starts below 2.
+    '''
+    if start < 2:
+        raise ValueError("Chunks must start at 2 or above")
+
+    result = {
+        'start': start,
+        'stop': stop,
+        'failed': None,
+        'max_stopping_time': (start, 0),
+        'max_excursion': (start, start),
+    }
+
+    collector = None
+    if collect:
+        from records import StatsCollector
+        collector = result['stats'] = StatsCollector()
+
+    flags = None
+    if sieve_k is not None:
+        from sieve import load_sieve, DESCENDS
+        sieve = load_sieve(k=sieve_k)
+        flags = np.frombuffer(sieve.flags, dtype=np.uint8)
+        mask = np.uint64(sieve.mask)
+        modulus = np.uint64(sieve.modulus)
+
+    for low in range(start, stop, batch_size):
+        numbers = np.arange(low, min(low + batch_size, stop), dtype=np.uint64)
+        if flags is not None:
+            numbers = numbers[(numbers < modulus) | (flags[numbers & mask] != DESCENDS)]
+            if not numbers.size:
+                continue
+
+        stopping_times, peaks, big_peaks = descend_batch(numbers, max_steps)
+
+        failures = np.flatnonzero(stopping_times < 0)
+        if failures.size:
+            # Keep only what comes before the first failure, like verify_chunk()
+            first = failures[0]
+            failed = int(numbers[first])
+            numbers, stopping_times, peaks, big_peaks = numbers[:first], stopping_times[:first], peaks[:first], big_peaks[:first]
+            result['failed'] = failed
+            result['stop'] = failed
+
+        if stopping_times.size:
+            if collector is not None:
+                _collect_batch(collector, numbers, stopping_times, peaks, big_peaks)
+
+            longest = int(np.argmax(stopping_times))
+            if stopping_times[longest] > result['max_stopping_time'][1]:
+                result['max_stopping_time'] = (int(numbers[longest]), int(stopping_times[longest]))
+
+            highest = int(np.argmax(peaks))
+            if int(peaks[highest]) > result['max_excursion'][1]:
+                result['max_excursion'] = (int(numbers[highest]), int(peaks[highest]))
+
+            for offset in np.flatnonzero(big_peaks):
+                if big_peaks[offset] > result['max_excursion'][1]:
+                    result['max_excursion'] = (int(numbers[offset]), big_peaks[offset])
+
+        if result['failed'] is not None:
+            break
+
+    return result
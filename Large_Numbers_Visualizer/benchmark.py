@@ -0,0 +1,187 @@
+import os, subprocess, sys
+from statistics import median
+from time import perf_counter
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+HEAVY_MODULES = ['scipy', 'matplotlib']
+
+def legacy_print_simulation_stats(stats: dict, verbose: bool = False, probability_precision: int = 5, p_precision: int = 3, min_width: int = 0) -> str:
+    '''Original version, kept for comparison.'''
+
+    expected_keys = [
+            'sides',                 # Number of sides on simulated die (int)
+            'number_of_rolls',       # Number of times the die roll was simulated (int)
+            'counts',                # Number of times each face was rolled (list[tuple[int, int]])
+            'probabilities',         # List of probability representation of counts; counts[number]/number of rolls (list[tuple[int, float]])
+            'expected_probability',  # Probability of each side assuming a fair die (float)
+            'bias_threshold',        # Directly bias_threshold (float)
+            'simple_fair',           # Determines whether all probabilities are within bias_threshold of their expected theoretical values (bool)
+            'chi2_fair'              # Result of Chi-Squared test on given alpha tuple[bool, float]
+    ]
+    
+    # Check for missing keys
+    missing_keys = [key for key in expected_keys if key not in stats]
+    if missing_keys:
+        raise ValueError(f"Missing expected keys: {', '.join(missing_keys)}")
+
+    # Header
+    summary = f"{stats['sides']} sides tested on {stats['number_of_rolls']:,} rolls"
+    expected_prob_str = f"We expect to see a probability of {stats['expected_probability']:0.{probability_precision}f} in a fair die with {stats['sides']} sides"
+
+    # Probabilities
+    max_count_length = len(str(max(count for _, count in stats['counts'])))
+    max_count_length += 2 + max_count_length//3 # account for commas
+    max_count_length = 5 if max_count_length < 5 else max_count_length
+    
+    probabilities_header = f"|{'Face #':^8}|{'Count':^{max_count_length}}|{'Probability':^13}|"
+    probabilities_breaker = f"|{'':-^8}|{'':-^{max_count_length}}|{'':-^13}|"
+    probabilities_rows = [
+        f"|{i:^8}|{count:^{max_count_length},}|{probability:^13.{probability_precision}f}|"
+        for (i, count), (_, probability) in zip(stats['counts'], stats['probabilities'])
+    ]
+    
+    # Fairness
+    fairness_header = f"We used an alpha of {stats['bias_threshold']:.{p_precision}f} for the following fairness tests:"
+    simple_fairness = f"We evaluated the die to be {'fair' if stats['simple_fair'] else 'unfair'} using the simple test"
+    chi2_fairness = f"At p={stats['chi2_fair'][1]:.{p_precision}f} we evaluated the die to be {'fair' if stats['chi2_fair'][0] else 'unfair'} using a Chi^2 test"
+    
+    # Finding widest line for width
+    width = max(
+        len(summary), 
+        len(expected_prob_str), 
+        len(probabilities_header),
+        len(probabilities_rows[0]), 
+        len(simple_fairness), 
+        len(chi2_fairness),
+        min_width-6 # -6 because we add 4 whitespace and 2 edgelines
+    ) + 4
+
+    formatted_sections = {
+        'summary': f'{summary:^{width}}',
+        'expected_prob_str': f'{expected_prob_str:^{width}}',
+        'probabilities_header': f'{probabilities_header:-^{width}}',
+        'probabilities_breaker': f'{probabilities_breaker:-^{width}}',
+        'fairness_header': f'{fairness_header:-^{width}}',
+        'simple_fairness': f'{simple_fairness:-^{width}}',
+        'chi2_fairness': f'{chi2_fairness:-^{width}}',
+    }
+
+    breaker = '-' * width
+
+    output = f"""|{breaker}|
+|{formatted_sections['summary']}|
+|{breaker}|
+|{formatted_sections['expected_prob_str']}|
+|{breaker}|
+|{formatted_sections['probabilities_header']}|
+|{formatted_sections['probabilities_breaker']}|
+"""
+    
+    for row in probabilities_rows:
+        output += f'|{row:-^{width}}|\n'
+    
+    output += f"""|{breaker}|
+|{formatted_sections['fairness_header']}|
+|{formatted_sections['simple_fairness']}|
+|{formatted_sections['chi2_fairness']}|
+|{breaker}|"""
+
+    
+    if verbose:
+        print(output)
+
+    return output
+
+def time_import(statement: str, runs: int = 5) -> tuple[float, list[str]]:
+    '''
+    Times a statement in fresh interpreters, so nothing is already imported or cached in memory
+
+    Parameters:
+    statement (str) : Python statement to run from the repo root, e.g. "import Large_Numbers_Visualizer.main"
+    runs (int)      : Fresh interpreters to start; the median time is reported
+
+    Returns:
+    The median seconds the statement took, and the heavy modules it left loaded
+    '''
+
+    script = (
+        "import sys, time\n"
+        "start = time.perf_counter()\n"
+        f"{statement}\n"
+        "elapsed = time.perf_counter() - start\n"
+        f"print(elapsed, *[name for name in {HEAVY_MODULES!r} if name in sys.modules])\n"
+    )
+
+    times = []
+    for _ in range(runs):
+        output = subprocess.run([sys.executable, '-c', script], cwd=ROOT, capture_output=True, text=True, check=True).stdout.split()
+        times.append(float(output[0]))
+
+    return median(times), output[1:]
+
+def time_call(function, *args) -> float:
+    '''Runs a function once and returns how long it took in seconds.'''
+    start = perf_counter()
+    function(*args)
+    return perf_counter() - start
+
+def benchmark_rendering(sides: int = 10_000, trials: int = 1_000, rolls: int = 10**6, seed: int = 0) -> None:
+    '''
+    Times rendering the statistics of many trials of a die with many faces, one report per trial and as combined outputs
+
+    Parameters:
+    sides (int)     : Number of sides on the die
+    trials (int)    : Number of trials to render
+    rolls (int)     : Rolls per trial
+    seed (int)      : Seed for the simulation
+    '''
+
+    import numpy as np
+    from .main import simulate, simulation_to_stats, print_simulation_stats, render_stats
+
+    rng = np.random.default_rng(seed)  # One generator for every trial, so each trial is a fresh draw
+    all_stats = list(simulation_to_stats(sides, [simulate(sides, rolls, rng=rng, counts_only=True) for _ in range(trials)]).values())
+    assert legacy_print_simulation_stats(all_stats[0]) == print_simulation_stats(all_stats[0])
+
+    print(f"Rendering {trials:,} trials of a {sides:,}-sided die")
+    legacy_time = time_call(lambda: [legacy_print_simulation_stats(stats) for stats in all_stats])
+    new_time = time_call(lambda: [print_simulation_stats(stats) for stats in all_stats])
+    print(f"{'print_simulation_stats, original':<45}{legacy_time:>10.4f}s")
+    print(f"{'print_simulation_stats':<45}{new_time:>10.4f}s{legacy_time / new_time:>8.1f}x")
+    for output in ('table', 'csv', 'jsonl'):
+        print(f"{f'render_stats ({output})':<45}{time_call(render_stats, all_stats, output):>10.4f}s")
+
+def benchmark(budget: float = 0.25, runs: int = 5) -> bool:
+    '''
+    Checks that importing main stays within its startup budget and loads no heavy modules
+
+    Parameters:
+    budget (float)  : Most seconds importing main may take
+    runs (int)      : Fresh interpreters to time each import in
+
+    Returns:
+    True if the import met its budget without loading SciPy or matplotlib
+    '''
+
+    main_time, main_heavy = time_import('import Large_Numbers_Visualizer.main', runs)
+    heavy_time, _ = time_import('import matplotlib.pyplot, scipy.stats', runs)
+    numpy_time, _ = time_import('import numpy', runs)
+
+    print(f"{'import numpy (floor)':<45}{numpy_time:>10.4f}s")
+    print(f"{'import matplotlib.pyplot, scipy.stats':<45}{heavy_time:>10.4f}s")
+    print(f"{'import main':<45}{main_time:>10.4f}s  (budget {budget:.4f}s)")
+
+    passed = main_time <= budget and not main_heavy
+    if main_heavy:
+        print(f"'import main' loaded {', '.join(main_heavy)}")
+    print('PASS' if passed else 'FAIL')
+
+    return passed
+
+
+if __name__ == '__main__':
+    # Run from the repo root: python -m Large_Numbers_Visualizer.benchmark
+    passed = benchmark()
+    print()
+    benchmark_rendering()
+    sys.exit(0 if passed else 1)
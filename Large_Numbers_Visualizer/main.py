@@ -1,19 +1,80 @@
-import random
-import matplotlib.pyplot as plt
-import scipy.stats as stats
+import json, math
+import numpy as np
 from collections import Counter
 
-def simulate(sides: int, n_list: int | list[int], bias: list[float] = None) -> list | dict:
+from rng_streams import as_generator, fill_integers
+
+# matplotlib and SciPy are imported inside the functions that need them, so importing this module stays cheap.
+# Chi^2 tests with up to this many degrees of freedom use the built-in chi2_sf() instead of SciPy
+CHI2_SERIES_LIMIT = 1_000
+
+# Decimal places for probabilities in CSV output from render_stats(); counts are exact, so this only needs to be plenty
+CSV_PRECISION = 12
+
+def chi2_sf(statistic: float | np.ndarray, dof: int) -> float | np.ndarray:
+    '''
+    Survival function (p-value) of the Chi^2 distribution, without SciPy for the common case
+
+    With k = dof / 2 and x = statistic / 2, the p-value is the regularized upper incomplete gamma function Q(k, x).
+    For whole k that is the chance a Poisson(x) variable is below k, a finite sum; for half-whole k the same sum runs
+    over half-whole terms plus erfc(sqrt(x)). Every term is formed in log space, so nothing underflows on the way.
+    Above CHI2_SERIES_LIMIT degrees of freedom the sum gets long, and SciPy is loaded instead
+
+    Parameters:
+    statistic (float | np.ndarray)  : Chi^2 statistic(s)
+    dof (int)                       : Degrees of freedom
+
+    Returns:
+    The p-value for each statistic, as a float or an array matching statistic. NaN when dof is less than 1 (a one-sided die),
+    as scipy.stats.chisquare gives
+    '''
+
+    if dof < 1:
+        p = np.full(np.shape(statistic), np.nan)
+        return float(p) if p.ndim == 0 else p
+
+    if dof > CHI2_SERIES_LIMIT:
+        import scipy.stats as stats
+        p = stats.chi2.sf(statistic, dof)
+        return float(p) if np.ndim(p) == 0 else p
+
+    x = np.asarray(statistic, dtype=float) / 2
+    log_x = np.log(np.where(x > 0, x, 1.0))
+    k, odd = divmod(dof, 2)
+
+    if odd:
+        p = np.vectorize(math.erfc, otypes=[float])(np.sqrt(x))
+        offset = 0.5
+    else:
+        p = np.zeros_like(x)
+        offset = 0.0
+
+    for i in range(k):
+        p = p + np.exp(-x + (i + offset) * log_x - math.lgamma(i + offset + 1))
+
+    p = np.where(x > 0, np.minimum(p, 1.0), 1.0)
+    return float(p) if p.ndim == 0 else p
+
+def simulate(sides: int, n_list: int | list[int], bias: list[float] = None, rng = None, counts_only: bool = False, nested: bool = False) -> list | np.ndarray | dict:
     '''
     Simulates a given die for random number generation over a given number of trials
 
+    Rolls are drawn in bulk from a NumPy generator, so a seed or a stream from rng_streams.RandomStreams reproduces them exactly.
+    With counts_only, no rolls are kept: the per-face counts of n rolls follow a multinomial distribution, so they are drawn
+    directly in one call, which takes microseconds and a few hundred bytes no matter how large n is.
+    With nested, every trial is a prefix of one stream of rolls: only the rolls between consecutive trial sizes are drawn,
+    so a whole list of trial sizes costs the same as its largest trial
+
     Parameters:
     sides (int)             : Number of sides on the die
     n_list (int | list[int]): Either a single trial size or a list of trial sizes
     bias (list[float])      : List of probabilities for the die. Default is a fair die with even distribution
+    rng                     : A seed, SeedSequence, RandomStreams or numpy Generator. Default is fresh entropy
+    counts_only (bool)      : Return how many times each face was rolled (np.ndarray, index 0 is face 1) instead of every roll
+    nested (bool)           : Take every trial as a cumulative snapshot of one stream instead of drawing each trial independently
 
     Returns:
-    Either a single list if only one trial is performed, or a dictionary where keys are trial sizes and values are the simulated trials
+    Either a single list (or count vector) if only one trial is performed, or a dictionary where keys are trial sizes and values are the simulated trials
 
     Raises:
     ValueError if the size of bias is not equal to the number of sides, or n_list is not an accepted type
@@ -22,21 +83,117 @@ def simulate(sides: int, n_list: int | list[int], bias: list[float] = None) -> l
     if bias and len(bias) != sides:
         raise ValueError("The length of 'bias' must match the number of sides.")
 
+    generator = as_generator(rng)
+    probabilities = np.asarray(bias, dtype=float) / sum(bias) if bias else None  # Weights need not sum to 1, as with random.choices
+
+    def roll(n: int) -> list[int] | np.ndarray:
+        if counts_only:
+            return generator.multinomial(n, np.full(sides, 1 / sides) if probabilities is None else probabilities)
+        if probabilities is None:
+            faces = fill_integers(generator, sides, np.empty(n, dtype=np.int64))
+        else:
+            faces = generator.choice(sides, size=n, p=probabilities)
+        return (faces + 1).tolist()
+
     if isinstance(n_list, int):
-        return random.choices(range(1, sides+1), bias, k = n_list)
+        return roll(n_list)
+    elif isinstance(n_list, list) and nested:
+        # Draw only the rolls between one snapshot and the next, and keep a running total
+        trials = {}
+        previous, total = 0, np.zeros(sides, dtype=np.int64) if counts_only else []
+        for n in sorted(set(n_list)):
+            if counts_only:
+                total = total + roll(n - previous)
+            else:
+                total.extend(roll(n - previous))
+            trials[n] = total if counts_only else total[:]
+            previous = n
+        return {n: trials[n] for n in n_list}
     elif isinstance(n_list, list):
-        return {n: random.choices(range(1, sides+1), bias, k=n) for n in n_list}
+        return {n: roll(n) for n in n_list}
 
     else: 
         raise ValueError(f"'n_list' must be a list of integers or a single integer, got {type(n_list)}")
 
-def simulation_to_stats(sides: int, simulation: list[int] | list[list[int]] | dict, bias_threshold: float = 0.05) -> dict:
+def convergence_curve(sides: int, max_n: int, bias: list[float] = None, rng = None, points: int = 50, min_n: int = 10) -> dict:
+    '''
+    Tracks how a Chi^2 fairness test settles as one stream of rolls grows
+
+    Counts are snapshotted at log-spaced roll counts of a single nested simulation, so the whole curve costs the same as max_n rolls
+    in count-only mode, and every test is computed at once with NumPy
+
+    Parameters:
+    sides (int)         : Number of sides on the die
+    max_n (int)         : Rolls at the last checkpoint
+    bias (list[float])  : List of probabilities for the die. Default is a fair die with even distribution
+    rng                 : A seed, SeedSequence, RandomStreams or numpy Generator. Default is fresh entropy
+    points (int)        : Number of log-spaced checkpoints, fewer if they collide at small n
+    min_n (int)         : Rolls at the first checkpoint
+
+    Returns:
+    A dictionary of numpy arrays, one entry per checkpoint:
+        'n'         : Rolls at each checkpoint
+        'counts'    : Counts of each face at each checkpoint, shape (checkpoints, sides)
+        'statistic' : Chi^2 statistic against a fair die
+        'p_value'   : p-value of the Chi^2 test
+
+    Raises:
+    ValueError if min_n is not between 1 and max_n
+    '''
+
+    if not 1 <= min_n <= max_n:
+        raise ValueError("'min_n' must be between 1 and 'max_n'.")
+
+    checkpoints = np.unique(np.geomspace(min_n, max_n, points).round().astype(np.int64)).tolist()
+    trials = simulate(sides, checkpoints, bias, rng, counts_only=True, nested=True)
+
+    n = np.array(checkpoints, dtype=np.int64)
+    counts = np.stack([trials[checkpoint] for checkpoint in checkpoints])
+    expected = n[:, None] / sides
+    statistic = ((counts - expected) ** 2 / expected).sum(axis=1)
+
+    return {
+        'n': n,
+        'counts': counts,
+        'statistic': statistic,
+        'p_value': chi2_sf(statistic, sides - 1),
+    }
+
+def plot_convergence(curve: dict, bias_threshold: float = 0.05, file_name: str = None) -> None:
+    '''
+    Plots a convergence curve from convergence_curve(), loading matplotlib only when called
+
+    Parameters:
+    curve (dict)            : Output of convergence_curve()
+    bias_threshold (float)  : Alpha value drawn as the line between "fair" and "unfair"
+    file_name (str)         : Saves the figure here instead of showing it, if given
+    '''
+
+    import matplotlib.pyplot as plt
+
+    figure, axis = plt.subplots()
+    axis.semilogx(curve['n'], curve['p_value'], marker='.')
+    axis.axhline(bias_threshold, color='red', linestyle='--', label=f'alpha = {bias_threshold}')
+    axis.set_xlabel('Number of rolls')
+    axis.set_ylabel('Chi^2 p-value')
+    axis.set_ylim(0, 1)
+    axis.legend()
+
+    if file_name:
+        figure.savefig(file_name)
+        plt.close(figure)
+    else:
+        plt.show()
+
+def simulation_to_stats(sides: int, simulation: list[int] | np.ndarray | list[list[int] | np.ndarray] | dict, bias_threshold: float = 0.05) -> dict:
     '''
     Translates a simulation from simulate() into statistics for analysis
 
+    Any trial may be given as a count vector (np.ndarray of per-face counts, as from simulate(counts_only=True)) instead of a list of rolls
+
     Parameters: 
     sides (int)                                         : Number of sides on the simulated die
-    simulation (list[int] or list[list[int]] or dict)   : Either a single trial (list[int]), a list of trials (list[list[int]]), or a dictionary output from simulate()
+    simulation (list[int] or list[list[int]] or dict)   : Either a single trial (list[int] or count vector), a list of trials (list[list[int]]), or a dictionary output from simulate()
     bias_threshold (float)                              : Alpha value for "fairness"
 
     Returns:
@@ -55,13 +212,13 @@ def simulation_to_stats(sides: int, simulation: list[int] | list[list[int]] | di
     ValueError if simulation is of incorrect type
     '''
 
-    def get_stats(sides: int, simulation: list[int], bias_threshold: float) -> dict:
+    def get_stats(sides: int, simulation: list[int] | np.ndarray, bias_threshold: float) -> dict:
         '''
         Helper operation to simplify gathering stats to only the case of one trial
         
         Parameters: 
         sides (int)                                         : Number of sides on the simulated die
-        simulation (list[int])                              : A single trial (list[int])
+        simulation (list[int] or np.ndarray)                : A single trial (list[int]) or its count vector (np.ndarray)
         bias_threshold (float)                              : Alpha value for "fairness"
 
         
@@ -82,12 +239,22 @@ def simulation_to_stats(sides: int, simulation: list[int] | list[list[int]] | di
         # Sides
         data['sides'] = sides
 
-        # Number of Rolls
-        data['number_of_rolls'] = len(simulation)
+        if isinstance(simulation, np.ndarray):
+            if simulation.shape != (sides,):
+                raise ValueError(f"A count vector must have one count per side, got shape {simulation.shape}")
 
-        # Counts
-        count_helper = Counter(simulation)
-        data['counts'] = [(i, count_helper.get(i, 0)) for i in range(1, sides+1)]
+            # Number of Rolls
+            data['number_of_rolls'] = int(simulation.sum())
+
+            # Counts
+            data['counts'] = list(enumerate(simulation.tolist(), 1))
+        else:
+            # Number of Rolls
+            data['number_of_rolls'] = len(simulation)
+
+            # Counts
+            count_helper = Counter(simulation)
+            data['counts'] = [(i, count_helper.get(i, 0)) for i in range(1, sides+1)]
 
         # Probabilities
         data['probabilities'] = [(side, count / data['number_of_rolls']) for side, count in data['counts']]
@@ -102,17 +269,18 @@ def simulation_to_stats(sides: int, simulation: list[int] | list[list[int]] | di
         data['simple_fair'] = all(abs(probability - data['expected_probability']) <= bias_threshold for _, probability in data['probabilities'])
 
         # Chi-Squared Fair
-        counts = [count for _, count in data['counts']]
-        _, p = stats.chisquare(counts)
+        counts = np.array([count for _, count in data['counts']], dtype=float)
+        expected = counts.sum() / sides
+        p = chi2_sf(((counts - expected) ** 2).sum() / expected, sides - 1)
         data['chi2_fair'] = (bool(p > bias_threshold), float(p))
 
         return data
                 
 
-    if isinstance(simulation, list) and all(isinstance(i, int) for i in simulation):
+    if isinstance(simulation, np.ndarray) or (isinstance(simulation, list) and all(isinstance(i, int) for i in simulation)):
         # Single Trial
         data =  get_stats(sides, simulation, bias_threshold)
-    elif isinstance(simulation, list) and all(isinstance(i, list) for i in simulation):
+    elif isinstance(simulation, list) and all(isinstance(i, (list, np.ndarray)) for i in simulation):
         # List of Trials
         data = {}
         for trial_number, trial in enumerate(simulation, 1):
@@ -185,7 +353,7 @@ def print_simulation_stats(stats: dict, verbose: bool = False, probability_preci
         len(summary), 
         len(expected_prob_str), 
         len(probabilities_header),
-        len(probabilities_rows[0]), 
+        max(map(len, probabilities_rows)),
         len(simple_fairness), 
         len(chi2_fairness),
         min_width-6 # -6 because we add 4 whitespace and 2 edgelines
@@ -203,26 +371,105 @@ def print_simulation_stats(stats: dict, verbose: bool = False, probability_preci
 
     breaker = '-' * width
 
-    output = f"""|{breaker}|
-|{formatted_sections['summary']}|
-|{breaker}|
-|{formatted_sections['expected_prob_str']}|
-|{breaker}|
-|{formatted_sections['probabilities_header']}|
-|{formatted_sections['probabilities_breaker']}|
-"""
-    
-    for row in probabilities_rows:
-        output += f'|{row:-^{width}}|\n'
-    
-    output += f"""|{breaker}|
-|{formatted_sections['fairness_header']}|
-|{formatted_sections['simple_fairness']}|
-|{formatted_sections['chi2_fairness']}|
-|{breaker}|"""
+    output = '\n'.join([
+        f'|{breaker}|',
+        f"|{formatted_sections['summary']}|",
+        f'|{breaker}|',
+        f"|{formatted_sections['expected_prob_str']}|",
+        f'|{breaker}|',
+        f"|{formatted_sections['probabilities_header']}|",
+        f"|{formatted_sections['probabilities_breaker']}|",
+        *[f'|{row:-^{width}}|' for row in probabilities_rows],
+        f'|{breaker}|',
+        f"|{formatted_sections['fairness_header']}|",
+        f"|{formatted_sections['simple_fairness']}|",
+        f"|{formatted_sections['chi2_fairness']}|",
+        f'|{breaker}|',
+    ])
 
     
     if verbose:
         print(output)
 
     return output
+
+def render_stats(stats: dict | list[dict], output: str = 'table', probability_precision: int = 5, p_precision: int = 3) -> str:
+    '''
+    Renders many statistics dictionaries at once, as one combined table or in a machine-readable format
+
+    Every line is built with an f-string and the whole output with a single join. CSV gives probabilities to CSV_PRECISION
+    places, and JSON Lines writes NaN statistics (e.g. the p-value of a one-sided die) as null
+
+    Parameters:
+    stats (dict | list[dict])   : Output of simulation_to_stats(): one statistics dictionary, a dictionary of them keyed by trial, or a list of them
+    output (str)                : 'table' for a text table, 'csv' for one row per face of every trial, or 'jsonl' for one JSON object per trial
+    probability_precision (int) : Number of decimal places for probabilities in the table, default is 5
+    p_precision (int)           : Number of decimal places for p-values in the table, default is 3
+
+    Returns:
+    str : The rendered statistics
+
+    Raises:
+    ValueError if output is not a known format
+    '''
+
+    if 'sides' in stats:
+        trials = [('Trial 1', stats)]
+    elif isinstance(stats, dict):
+        trials = list(stats.items())
+    else:
+        trials = [(f'Trial {number}', trial) for number, trial in enumerate(stats, 1)]
+
+    if output == 'jsonl':
+        def finite(value: float) -> float | None:
+            return float(value) if math.isfinite(value) else None
+
+        return '\n'.join(
+            json.dumps({
+                'trial': label,
+                'sides': int(trial['sides']),
+                'number_of_rolls': int(trial['number_of_rolls']),
+                'bias_threshold': finite(trial['bias_threshold']),
+                'simple_fair': bool(trial['simple_fair']),
+                'chi2_fair': bool(trial['chi2_fair'][0]),
+                'chi2_p': finite(trial['chi2_fair'][1]),
+                'counts': [int(count) for _, count in trial['counts']],
+                'probabilities': [finite(probability) for _, probability in trial['probabilities']],
+            }, allow_nan=False)
+            for label, trial in trials)
+
+    if output == 'csv':
+        return '\n'.join([
+            'trial,face,count,probability',
+            *[f"{label},{face},{count},{probability:.{CSV_PRECISION}f}"
+              for label, trial in trials
+              for (face, count), (_, probability) in zip(trial['counts'], trial['probabilities'])],
+        ])
+
+    if output != 'table':
+        raise ValueError(f"'output' must be 'table', 'csv' or 'jsonl', got {output}")
+
+    # Column widths fit the widest cell of every trial
+    label_width = max(len('Trial'), *(len(label) for label, _ in trials)) + 2
+    face_width = max(len('Face #'), *(len(str(trial['sides'])) for _, trial in trials)) + 2
+    count_width = max(len('Rolls'), *(len(f"{trial['number_of_rolls']:,}") for _, trial in trials)) + 2
+    probability_width = max(len('Probability'), probability_precision + 2) + 2
+    p_width = max(len('Chi^2 p'), p_precision + 2) + 2
+
+    summary_header = f"|{'Trial':^{label_width}}|{'Sides':^{face_width}}|{'Rolls':^{count_width}}|{'Simple':^8}|{'Chi^2 p':^{p_width}}|{'Chi^2':^8}|"
+    summary_rows = [
+        f"|{label:^{label_width}}|{trial['sides']:^{face_width}}|{trial['number_of_rolls']:^{count_width},}|"
+        f"{'fair' if trial['simple_fair'] else 'unfair':^8}|{trial['chi2_fair'][1]:^{p_width}.{p_precision}f}|{'fair' if trial['chi2_fair'][0] else 'unfair':^8}|"
+        for label, trial in trials
+    ]
+    faces_header = f"|{'Trial':^{label_width}}|{'Face #':^{face_width}}|{'Count':^{count_width}}|{'Probability':^{probability_width}}|"
+    face_rows = [
+        f"|{label:^{label_width}}|{face:^{face_width}}|{count:^{count_width},}|{probability:^{probability_width}.{probability_precision}f}|"
+        for label, trial in trials
+        for (face, count), (_, probability) in zip(trial['counts'], trial['probabilities'])
+    ]
+
+    def underline(header: str) -> str:
+        return ''.join('|' if character == '|' else '-' for character in header)
+
+    return '\n'.join([summary_header, underline(summary_header), *summary_rows, '', faces_header, underline(faces_header), *face_rows])
@@ -0,0 +1,150 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from rng_streams import RandomStreams
+
+from .main import chi2_sf
+
+COLUMNS = ['config', 'sides', 'number_of_rolls', 'replicate', 'statistic', 'p_value', 'chi2_fair', 'max_deviation', 'simple_fair']
+
+def run_config(manifest: dict, config: int, sides: int, bias: list[float] | None, n: int, replicates: int, bias_threshold: float) -> dict:
+    '''
+    Simulates every replicate of one dice configuration and tests each for fairness at once
+
+    Configuration i always draws from stream i of the seed manifest, so results do not depend on how work is split between processes
+
+    Parameters:
+    manifest (dict)         : Seed manifest from rng_streams.RandomStreams.manifest()
+    config (int)            : Index of the configuration in the grid, which is also its stream
+    sides (int)             : Number of sides on the die
+    bias (list[float])      : Weights of each face, or None for a fair die
+    n (int)                 : Rolls per replicate
+    replicates (int)        : Independent trials of this configuration
+    bias_threshold (float)  : Alpha value for "fairness"
+
+    Returns:
+    A dictionary of numpy arrays with one entry per replicate, keyed by COLUMNS
+
+    Raises:
+    ValueError if the size of bias is not equal to the number of sides
+    '''
+
+    if bias and len(bias) != sides:
+        raise ValueError("The length of 'bias' must match the number of sides.")
+
+    generator = RandomStreams.from_manifest(manifest).generator(config)
+    probabilities = np.asarray(bias, dtype=float) / sum(bias) if bias else np.full(sides, 1 / sides)
+    counts = generator.multinomial(n, probabilities, size=replicates)
+
+    # The same tests as simulation_to_stats(), for every replicate at once
+    expected = n / sides
+    statistic = ((counts - expected) ** 2).sum(axis=1) / expected
+    p_value = chi2_sf(statistic, sides - 1)
+    max_deviation = np.abs(counts / n - 1 / sides).max(axis=1)
+
+    return {
+        'config': np.full(replicates, config, dtype=np.int64),
+        'sides': np.full(replicates, sides, dtype=np.int64),
+        'number_of_rolls': np.full(replicates, n, dtype=np.int64),
+        'replicate': np.arange(replicates, dtype=np.int64),
+        'statistic': statistic,
+        'p_value': p_value,
+        'chi2_fair': p_value > bias_threshold,
+        'max_deviation': max_deviation,
+        'simple_fair': max_deviation <= bias_threshold,
+    }
+
+def sweep(grid: list[tuple[int, list[float] | None, int]], bias_threshold: float = 0.05, replicates: int = 1, workers: int = None, seed = None) -> dict:
+    '''
+    Runs fairness tests over a grid of dice configurations across a pool of processes
+
+    Each replicate's counts are drawn directly from a multinomial distribution, so run time does not depend on the number of rolls
+
+    Parameters:
+    grid (list[tuple])      : (sides, bias, n) configurations; bias is a list of face weights or None for a fair die
+    bias_threshold (float)  : Alpha value for "fairness"
+    replicates (int)        : Independent trials of every configuration, for estimate_power()
+    workers (int)           : Worker processes. Default is the CPU count; 1 runs in this process
+    seed                    : Anything numpy.random.SeedSequence accepts, or a RandomStreams, for reproducible sweeps
+
+    Returns:
+    A table as a dictionary of equal-length numpy arrays with one row per replicate of every configuration, keyed by COLUMNS,
+    plus 'seed_manifest' for reproducing the sweep
+
+    Raises:
+    ValueError if replicates is less than 1 or a configuration is invalid
+    '''
+
+    if replicates < 1:
+        raise ValueError("'replicates' must be at least 1.")
+
+    streams = seed if isinstance(seed, RandomStreams) else RandomStreams(seed)
+    streams.generators(len(grid))  # Record every stream handed out in the manifest
+    manifest = streams.manifest()
+    jobs = [(manifest, config, sides, bias, n, replicates, bias_threshold) for config, (sides, bias, n) in enumerate(grid)]
+
+    workers = workers or os.cpu_count() or 1
+    if workers == 1 or len(jobs) == 1:
+        results = [run_config(*job) for job in jobs]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(run_config, *zip(*jobs), chunksize=max(1, len(jobs) // (4 * workers))))
+
+    table = {column: np.concatenate([result[column] for result in results]) for column in COLUMNS}
+    table['seed_manifest'] = manifest
+    return table
+
+def estimate_power(table: dict) -> dict:
+    '''
+    Estimates how often each configuration's die is called unfair, from a sweep with many replicates
+
+    For a biased die this is the power of the test at that number of rolls; for a fair die it is the false positive rate
+
+    Parameters:
+    table (dict) : Output of sweep()
+
+    Returns:
+    A table as a dictionary of numpy arrays with one row per configuration:
+        'config'            : Index of the configuration in the grid
+        'sides'             : Number of sides on the die
+        'number_of_rolls'   : Rolls per replicate
+        'replicates'        : Replicates run
+        'chi2_power'        : Share of replicates the Chi^2 test called unfair
+        'simple_power'      : Share of replicates the simple test called unfair
+    '''
+
+    configs = table['config']
+    size = int(configs.max()) + 1 if configs.size else 0
+    replicates = np.bincount(configs, minlength=size)
+    first = np.unique(configs, return_index=True)[1]
+
+    return {
+        'config': np.arange(size),
+        'sides': table['sides'][first],
+        'number_of_rolls': table['number_of_rolls'][first],
+        'replicates': replicates,
+        'chi2_power': np.bincount(configs, weights=~table['chi2_fair'], minlength=size) / replicates,
+        'simple_power': np.bincount(configs, weights=~table['simple_fair'], minlength=size) / replicates,
+    }
+
+def write_table(table: dict, file_name: str) -> None:
+    '''
+    Writes a table from sweep() or estimate_power() to a CSV file in one pass
+
+    Parameters:
+    table (dict)    : Table of equal-length numpy arrays; non-array entries such as the seed manifest are skipped
+    file_name (str) : Path of the CSV file
+
+    Raises:
+    ValueError if the file could not be written
+    '''
+
+    columns = {name: column for name, column in table.items() if isinstance(column, np.ndarray)}
+    formats = ['%.10g' if column.dtype.kind == 'f' else '%d' for column in columns.values()]
+
+    try:
+        np.savetxt(file_name, np.column_stack(list(columns.values())), fmt=formats, delimiter=',', header=','.join(columns), comments='')
+    except OSError as e:
+        raise ValueError(f"Could not write table: {file_name}") from e
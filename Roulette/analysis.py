@@ -0,0 +1,158 @@
+'''Exact expected value, variance and outcome distributions for Roulette bet slates'''
+
+from fractions import Fraction
+from math import gcd
+
+import numpy as np
+
+
+def _net_by_space(wheel, bets):
+    """
+    Net result of a whole slate for every space the ball can land in.
+    """
+    return wheel.payout_matrix(bets).sum(axis=1)
+
+def spin_distribution(wheel, bets):
+    """
+    Exact distribution of a slate's net result over a single spin.
+
+    Every space is equally likely, so the distribution is just the slate's net result on
+    each space, with equal results merged.
+
+    Parameters:
+    - wheel (RouletteWheel): The table the bets are placed on.
+    - bets (list): Bets as accepted by RouletteWheel.payout_matrix().
+
+    Returns:
+    - distribution (dict):
+        'values'       : Every possible net result, ascending (np.ndarray)
+        'probabilities': Probability of each result (np.ndarray)
+        'ev'           : Expected net result (float)
+        'variance'     : Variance of the net result (float)
+        'house_edge'   : Expected loss as a share of the total stake (float)
+
+    Raises:
+    - ValueError: If the slate has no bets.
+    """
+    if not bets:
+        raise ValueError("Slate must contain at least one bet")
+
+    net = _net_by_space(wheel, bets)
+    values, counts = np.unique(net, return_counts=True)
+    probabilities = counts / net.size
+    stake = sum(bet["amount"] if isinstance(bet, dict) else bet[1] for bet in bets)
+
+    return {
+        "values": values,
+        "probabilities": probabilities,
+        "ev": float(net.mean()),
+        "variance": float(net.var()),
+        "house_edge": float(-net.mean() / stake),
+    }
+
+def n_spin_distribution(wheel, bets, n_spins, max_denominator=1_000):
+    """
+    Exact distribution of a slate's total net result over many independent spins.
+
+    Single-spin results are placed on a common integer grid, and the n-spin distribution is
+    the n-fold convolution of the single-spin one, computed in one step with an FFT.
+
+    Parameters:
+    - wheel (RouletteWheel): The table the bets are placed on.
+    - bets (list): Bets as accepted by RouletteWheel.payout_matrix().
+    - n_spins (int): Number of spins.
+    - max_denominator (int): Stakes are treated as fractions with at most this denominator (1,000 covers tenths of a cent on whole-dollar units).
+
+    Returns:
+    - distribution (dict):
+        'values'       : Every possible total with non-negligible probability, ascending (np.ndarray)
+        'probabilities': Probability of each total (np.ndarray)
+        'ev'           : Expected total (float)
+        'variance'     : Variance of the total (float)
+    """
+    if n_spins <= 0:
+        raise ValueError("Number of spins must be greater than 0.")
+
+    single = spin_distribution(wheel, bets)
+
+    # Find the largest step that every result is a whole multiple of
+    fractions = [Fraction(float(value)).limit_denominator(max_denominator) for value in single["values"]]
+    denominator = 1
+    for fraction in fractions:
+        denominator = denominator * fraction.denominator // gcd(denominator, fraction.denominator)
+    numerators = [int(fraction * denominator) for fraction in fractions]
+    step = 0
+    for numerator in numerators:
+        step = gcd(step, numerator)
+    step = step or 1
+
+    low = min(numerators)
+    offsets = [(numerator - low) // step for numerator in numerators]
+    pmf = np.zeros(max(offsets) + 1)
+    pmf[offsets] = single["probabilities"]
+
+    # The total's support spans n times the single-spin support
+    size = n_spins * (pmf.size - 1) + 1
+    fft_size = 1 << (size - 1).bit_length()
+    total = np.fft.irfft(np.fft.rfft(pmf, fft_size) ** n_spins, fft_size)[:size]
+    total[total < 1e-15] = 0.0
+    total /= total.sum()
+
+    support = np.flatnonzero(total)
+    values = (n_spins * low + support * step) / denominator
+
+    return {
+        "values": values,
+        "probabilities": total[support],
+        "ev": n_spins * single["ev"],
+        "variance": n_spins * single["variance"],
+    }
+
+def score_slates(wheel, slates):
+    """
+    Exact expected value and variance of many candidate slates at once.
+
+    Every bet's row of the table's coverage matrix is scattered into one (slates, spaces)
+    array, so scoring costs one dictionary lookup per bet.
+
+    Parameters:
+    - wheel (RouletteWheel): The table the bets are placed on.
+    - slates (list[list]): Each slate is a list of bets as accepted by RouletteWheel.payout_matrix().
+
+    Returns:
+    - scores (dict):
+        'ev'        : Expected net result of each slate (np.ndarray)
+        'variance'  : Variance of each slate's net result (np.ndarray)
+        'house_edge': Expected loss of each slate as a share of its total stake (np.ndarray)
+
+    Raises:
+    - ValueError: If any slate has no bets.
+    """
+    slate_of, amounts, returns, rows = [], [], [], []
+
+    for slate, bets in enumerate(slates):
+        if not bets:
+            raise ValueError("Slate must contain at least one bet")
+        for bet in bets:
+            if isinstance(bet, dict):
+                bet_type, amount, details = bet["bet_type"], bet["amount"], bet["details"]
+            else:
+                bet_type, amount, details = bet
+
+            rows.append(wheel._validate_bet(bet_type, amount, details))
+            slate_of.append(slate)
+            amounts.append(amount)
+            returns.append(amount * (wheel.payout_table[bet_type] + 1))  # Stake back plus winnings
+
+    # Every bet loses its stake, then wins stake plus payout on the spaces it covers
+    net = np.zeros((len(slates), len(wheel.spaces)))
+    np.add.at(net, np.array(slate_of, dtype=np.intp), np.array(returns)[:, None] * wheel.layout.coverage[rows])
+    stakes = np.bincount(slate_of, weights=amounts, minlength=len(slates))
+    net -= stakes[:, None]
+    ev = net.mean(axis=1)
+
+    return {
+        "ev": ev,
+        "variance": net.var(axis=1),
+        "house_edge": -ev / stakes,
+    }
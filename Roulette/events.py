@@ -0,0 +1,224 @@
+'''Structured event sinks for recording what happens at the Roulette Wheel'''
+
+import json, os
+from abc import ABC, abstractmethod
+
+import numpy as np
+
+# Bet types in the order their codes are assigned in bet records
+BET_TYPES = ("straight_up", "split", "street", "corner", "line", "column", "dozen",
+             "red_or_black", "odd_or_even", "low_or_high", "five_number")
+BET_TYPE_CODES = {bet_type: code for code, bet_type in enumerate(BET_TYPES)}
+
+# Every event is a typed record, and events of one kind always travel as a structured array
+EVENT_DTYPES = {
+    "bet": np.dtype([("spin", "<u8"), ("bet", "<u4"), ("bet_type", "u1"), ("row", "<u2"), ("amount", "<f8")]),
+    "spin": np.dtype([("spin", "<u8"), ("pocket", "u1")]),
+    "payout": np.dtype([("spin", "<u8"), ("bet", "<u4"), ("net", "<f8")]),
+}
+
+
+class EventSink(ABC):
+    """
+    Receives events from a RouletteWheel.
+
+    A wheel only ever calls write(), once per event for single spins and once per chunk for
+    bulk simulations, so a sink decides for itself whether to keep, forward or drop records.
+    """
+
+    @abstractmethod
+    def write(self, kind, records):
+        """
+        Take a batch of events of one kind.
+
+        Parameters:
+        - kind (str): 'bet', 'spin' or 'payout'.
+        - records (np.ndarray): Structured array with dtype EVENT_DTYPES[kind]. Only valid during the call; copy it to keep it.
+        """
+
+    def close(self):
+        """
+        Finish any pending work. Does nothing unless the sink buffers.
+        """
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+class CallbackSink(EventSink):
+    """
+    Hands every batch of events to a function.
+
+    Parameters:
+    - callback (callable): Called as callback(kind, records).
+    """
+
+    def __init__(self, callback):
+        self.callback = callback
+
+    def write(self, kind, records):
+        self.callback(kind, records)
+
+
+class RingBuffer(EventSink):
+    """
+    Keeps only the most recent events of each kind in fixed, preallocated arrays.
+
+    Parameters:
+    - capacity (int): Events kept per kind.
+    """
+
+    def __init__(self, capacity=1_000_000):
+        if capacity <= 0:
+            raise ValueError("Capacity must be greater than 0.")
+        self.capacity = capacity
+        self._buffers = {kind: np.empty(capacity, dtype=dtype) for kind, dtype in EVENT_DTYPES.items()}
+        self._written = dict.fromkeys(EVENT_DTYPES, 0)
+
+    def write(self, kind, records):
+        buffer = self._buffers[kind]
+        if len(records) >= self.capacity:
+            records = records[-self.capacity:]
+
+        start = self._written[kind] % self.capacity
+        head = min(len(records), self.capacity - start)
+        buffer[start:start + head] = records[:head]
+        buffer[:len(records) - head] = records[head:]
+        self._written[kind] += len(records)
+
+    def records(self, kind):
+        """
+        The events of one kind still held, oldest first.
+
+        Returns:
+        - records (np.ndarray): A copy, with dtype EVENT_DTYPES[kind].
+        """
+        written = self._written[kind]
+        buffer = self._buffers[kind]
+        if written <= self.capacity:
+            return buffer[:written].copy()
+        start = written % self.capacity
+        return np.concatenate((buffer[start:], buffer[:start]))
+
+
+class ColumnarWriter(EventSink):
+    """
+    Writes every event to disk as columns, for audit logs of long runs.
+
+    Events are gathered in preallocated batches and each field is appended to its own file of
+    little-endian values, described by a manifest.json so a log can be read back with
+    read_events() or numpy.fromfile(). Use it as a context manager, or call close(), so the
+    last batch and the manifest get written.
+
+    Parameters:
+    - directory (str): Directory to write to. Created if needed, and any earlier log in it is replaced.
+    - batch_size (int): Events of each kind gathered before writing.
+    """
+
+    def __init__(self, directory, batch_size=1 << 16):
+        self.directory = directory
+        self.batch_size = batch_size
+        self._batches = {kind: np.empty(batch_size, dtype=dtype) for kind, dtype in EVENT_DTYPES.items()}
+        self._pending = dict.fromkeys(EVENT_DTYPES, 0)
+        self._written = dict.fromkeys(EVENT_DTYPES, 0)
+        self._files = {}
+
+        try:
+            os.makedirs(directory, exist_ok=True)
+            for kind, dtype in EVENT_DTYPES.items():
+                for field in dtype.names:
+                    self._files[(kind, field)] = open(os.path.join(directory, f"{kind}.{field}.bin"), "wb")
+        except OSError as e:
+            self._close_files()
+            raise ValueError(f"Could not open event log in: {directory}") from e
+
+    def write(self, kind, records):
+        pending = self._pending[kind]
+
+        # Large batches skip the buffer entirely
+        if pending + len(records) > self.batch_size:
+            self._flush(kind)
+            if len(records) >= self.batch_size:
+                self._write_columns(kind, records)
+                return
+            pending = 0
+
+        self._batches[kind][pending:pending + len(records)] = records
+        self._pending[kind] = pending + len(records)
+
+    def _write_columns(self, kind, records):
+        try:
+            for field in records.dtype.names:
+                np.ascontiguousarray(records[field]).tofile(self._files[(kind, field)])
+        except OSError as e:
+            raise ValueError(f"Could not write event log in: {self.directory}") from e
+        self._written[kind] += len(records)
+
+    def _flush(self, kind):
+        if self._pending[kind]:
+            self._write_columns(kind, self._batches[kind][:self._pending[kind]])
+            self._pending[kind] = 0
+
+    def _close_files(self):
+        for file in self._files.values():
+            file.close()
+        self._files = {}
+
+    def close(self):
+        if not self._files:
+            return
+
+        try:
+            for kind in EVENT_DTYPES:
+                self._flush(kind)
+        finally:
+            self._close_files()
+
+        manifest = {kind: {"length": self._written[kind],
+                           "columns": {field: {"file": f"{kind}.{field}.bin", "dtype": dtype[field].str} for field in dtype.names}}
+                    for kind, dtype in EVENT_DTYPES.items()}
+        manifest["bet_types"] = list(BET_TYPES)
+
+        try:
+            with open(os.path.join(self.directory, "manifest.json"), "w") as file:
+                json.dump(manifest, file, indent=4)
+        except OSError as e:
+            raise ValueError(f"Could not write event log in: {self.directory}") from e
+
+
+def read_events(directory, kind, mmap=True):
+    """
+    Read one kind of event back from a log written by ColumnarWriter.
+
+    Parameters:
+    - directory (str): Directory the log was written to.
+    - kind (str): 'bet', 'spin' or 'payout'.
+    - mmap (bool): Map the column files instead of reading them, so huge logs cost no memory up front.
+
+    Returns:
+    - columns (dict): Field name to np.ndarray.
+
+    Raises:
+    - ValueError: If the directory has no manifest or a column is missing.
+    """
+    try:
+        with open(os.path.join(directory, "manifest.json"), "r") as file:
+            manifest = json.load(file)[kind]
+
+        columns = {}
+        for field, column in manifest["columns"].items():
+            path = os.path.join(directory, column["file"])
+            if not manifest["length"]:
+                columns[field] = np.empty(0, dtype=column["dtype"])
+            elif mmap:
+                columns[field] = np.memmap(path, dtype=column["dtype"], mode="r", shape=(manifest["length"],))
+            else:
+                columns[field] = np.fromfile(path, dtype=column["dtype"], count=manifest["length"])
+
+        return columns
+
+    except (OSError, KeyError, json.JSONDecodeError) as e:
+        raise ValueError(f"Could not read '{kind}' events from: {directory}") from e
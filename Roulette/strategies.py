@@ -0,0 +1,210 @@
+'''Monte Carlo betting strategy sessions against the Roulette Wheel'''
+
+import os
+from abc import ABC, abstractmethod
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from rng_streams import RandomStreams
+
+from .wheel import RouletteWheel
+
+
+class Strategy(ABC):
+    """
+    A betting policy that picks each stake from how the session has gone so far.
+
+    Policies work on whole batches of sessions at once: every method receives and returns
+    one value per session, so thousands of sessions advance with a handful of array operations.
+
+    Parameters:
+    - base (float): The opening stake and the smallest stake the policy will place.
+    """
+
+    def __init__(self, base=1.0):
+        if base <= 0:
+            raise ValueError("Base stake must be greater than 0.")
+        self.base = base
+
+    def first_stakes(self, n_sessions):
+        """
+        Stakes for the first spin of each session.
+        """
+        return np.full(n_sessions, self.base, dtype=float)
+
+    @abstractmethod
+    def next_stakes(self, stakes, won, bankroll):
+        """
+        Stakes for the next spin.
+
+        Parameters:
+        - stakes (np.ndarray): What each session just staked.
+        - won (np.ndarray): Whether each session's last bet won.
+        - bankroll (np.ndarray): Each session's bankroll after the last spin.
+
+        Returns:
+        - stakes (np.ndarray): The next stakes, before being capped by bankroll or table limit.
+        """
+
+
+class Flat(Strategy):
+    """
+    Always stakes the base amount.
+    """
+
+    def next_stakes(self, stakes, won, bankroll):
+        return np.full(stakes.shape, self.base, dtype=float)
+
+
+class Martingale(Strategy):
+    """
+    Doubles the stake after every loss and drops back to the base after a win.
+    """
+
+    def next_stakes(self, stakes, won, bankroll):
+        return np.where(won, self.base, stakes * 2)
+
+
+class DAlembert(Strategy):
+    """
+    Raises the stake by one unit after a loss and lowers it by one unit after a win.
+
+    Parameters:
+    - base (float): The opening stake and the smallest stake the policy will place.
+    - unit (float): How much the stake moves each spin. Defaults to the base.
+    """
+
+    def __init__(self, base=1.0, unit=None):
+        super().__init__(base)
+        self.unit = base if unit is None else unit
+
+    def next_stakes(self, stakes, won, bankroll):
+        return np.where(won, np.maximum(stakes - self.unit, self.base), stakes + self.unit)
+
+
+def _run_batch(strategy, table_type, bet_type, details, n_sessions, bankroll, target, max_spins, table_limit, manifest, stream):
+    """
+    Play one batch of sessions side by side on its own random stream, rebuilt from the seed manifest.
+
+    Returns:
+    - final_bankrolls (np.ndarray): Bankroll at the end of each session.
+    - lengths (np.ndarray): Spins played in each session.
+    - ruined (np.ndarray): Whether each session ended unable to cover the base stake.
+    """
+    wheel = RouletteWheel(table_type)
+    row = wheel.layout.lookup(bet_type, details)
+    if row is None or bet_type not in wheel.payout_table:
+        raise ValueError(f"Invalid bet for a '{table_type}' table: {bet_type} {details}")
+
+    wins_on = wheel.layout.coverage[row].astype(bool)
+    payout = wheel.payout_table[bet_type]
+    rng = RandomStreams.from_manifest(manifest).generator(stream)
+
+    final_bankrolls = np.full(n_sessions, bankroll, dtype=float)
+    lengths = np.zeros(n_sessions, dtype=np.int32)
+    ruined = np.zeros(n_sessions, dtype=bool)
+
+    # Working arrays only hold sessions that are still playing
+    active = np.arange(n_sessions)
+    money = final_bankrolls.copy()
+    stakes = np.minimum(strategy.first_stakes(n_sessions), money)
+
+    for spin in range(1, max_spins + 1):
+        won = wins_on[rng.integers(0, len(wheel.spaces), size=active.size)]
+        money += np.where(won, stakes * payout, -stakes)
+
+        stakes = strategy.next_stakes(stakes, won, money)
+        if table_limit is not None:
+            stakes = np.minimum(stakes, table_limit)
+        stakes = np.minimum(stakes, money)
+
+        broke = money < strategy.base
+        done = broke | (money >= target) if target is not None else broke
+        if spin == max_spins:
+            done[:] = True
+
+        if done.any():
+            finished = active[done]
+            final_bankrolls[finished] = money[done]
+            lengths[finished] = spin
+            ruined[finished] = broke[done]
+
+            keep = ~done
+            active, money, stakes = active[keep], money[keep], stakes[keep]
+            if not active.size:
+                break
+
+    return final_bankrolls, lengths, ruined
+
+def run_sessions(strategy, n_sessions, bankroll, target=None, max_spins=1_000, bet_type="red_or_black", details="red",
+                 table_type="00", table_limit=None, workers=None, seed=None, batch_size=100_000):
+    """
+    Play many independent betting sessions across a pool of processes.
+
+    Sessions are split into fixed batches, and batch i draws from stream i of the seed's
+    RandomStreams, so results depend only on the seed and batch size, not on the worker count.
+    A session ends when it can no longer cover the base stake (ruin), reaches the target, or
+    has played max_spins spins.
+
+    Parameters:
+    - strategy (Strategy): The betting policy, e.g. Flat(), Martingale() or DAlembert().
+    - n_sessions (int): Number of sessions.
+    - bankroll (float): Starting bankroll of each session.
+    - target (float): Bankroll at which a session walks away a winner. Defaults to never.
+    - max_spins (int): Longest a session may last.
+    - bet_type (str), details: The single bet repeated every spin, as for RouletteWheel.place_bet().
+    - table_type (str): '0', '00' or '000'.
+    - table_limit (float): Largest stake the table accepts. Defaults to no limit.
+    - workers (int): Worker processes. Defaults to the CPU count; 1 runs in this process.
+    - seed: Anything numpy.random.SeedSequence accepts, or a RandomStreams, for reproducible runs.
+    - batch_size (int): Sessions played side by side in one batch.
+
+    Returns:
+    - results (dict):
+        'ruin_probability': Share of sessions that ended ruined (float)
+        'final_bankrolls' : Bankroll at the end of each session (np.ndarray)
+        'session_lengths' : Spins played in each session (np.ndarray)
+        'ruined'          : Whether each session ended ruined (np.ndarray)
+        'mean_length'     : Average spins per session (float)
+        'mean_bankroll'   : Average final bankroll (float)
+        'seed_manifest'   : The RandomStreams manifest that reproduces the run (dict)
+    """
+    if n_sessions <= 0:
+        raise ValueError("Number of sessions must be greater than 0.")
+
+    sizes = [min(batch_size, n_sessions - start) for start in range(0, n_sessions, batch_size)]
+    streams = seed if isinstance(seed, RandomStreams) else RandomStreams(seed)
+    streams.generators(len(sizes))  # Record every stream handed out in the manifest
+    manifest = streams.manifest()
+    jobs = [(strategy, table_type, bet_type, details, size, bankroll, target, max_spins, table_limit, manifest, stream)
+            for stream, size in enumerate(sizes)]
+
+    workers = workers or os.cpu_count() or 1
+    if workers == 1 or len(jobs) == 1:
+        batches = [_run_batch(*job) for job in jobs]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            batches = list(executor.map(_run_batch, *zip(*jobs)))
+
+    final_bankrolls = np.concatenate([batch[0] for batch in batches])
+    lengths = np.concatenate([batch[1] for batch in batches])
+    ruined = np.concatenate([batch[2] for batch in batches])
+
+    return {
+        "ruin_probability": float(ruined.mean()),
+        "final_bankrolls": final_bankrolls,
+        "session_lengths": lengths,
+        "ruined": ruined,
+        "mean_length": float(lengths.mean()),
+        "mean_bankroll": float(final_bankrolls.mean()),
+        "seed_manifest": manifest,
+    }
+
+
+if __name__ == '__main__':
+    # Run from the repo root: python -m Roulette.strategies
+    for strategy in (Flat(10), Martingale(10), DAlembert(10)):
+        results = run_sessions(strategy, 1_000_000, bankroll=1_000, target=2_000, table_limit=5_000, seed=0)
+        print(f"{type(strategy).__name__:<10} ruin {results['ruin_probability']:.3%} | "
+              f"mean length {results['mean_length']:,.1f} spins | mean bankroll {results['mean_bankroll']:,.2f}")
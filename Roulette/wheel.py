@@ -1,10 +1,201 @@
 '''Creation of the Roulette Wheel'''
 
-from random import choice
+import numpy as np
+
+from rng_streams import as_generator, fill_integers
+
+from .events import BET_TYPE_CODES, EVENT_DTYPES
+
+RED_NUMBERS = {1, 3, 5, 7, 9, 12, 14, 16, 18, 19, 21, 23, 25, 27, 30, 32, 34, 36}
+
+# Pockets are small integer codes: 1-36 are themselves, and the zeros get sentinel codes
+# after them, so a table with n zeros uses exactly the codes 0 to 35 + n
+ZERO, DOUBLE_ZERO, TRIPLE_ZERO = 0, 37, 38
+POCKET_NAMES = ["0"] + [str(num) for num in range(1, 37)] + ["00", "000"]
+POCKET_CODES = {name: code for code, name in enumerate(POCKET_NAMES)}
+
+# Pocket attributes, indexed by pocket code
+GREEN, RED, BLACK = 0, 1, 2
+ODD, EVEN = 1, 2  # Zeros have no parity (0)
+LOW, HIGH = 1, 2  # Zeros are in neither range (0)
+
+COLORS = np.zeros(len(POCKET_NAMES), dtype=np.uint8)
+PARITY = np.zeros(len(POCKET_NAMES), dtype=np.uint8)
+RANGES = np.zeros(len(POCKET_NAMES), dtype=np.uint8)
+DOZENS = np.zeros(len(POCKET_NAMES), dtype=np.uint8)
+COLUMNS = np.zeros(len(POCKET_NAMES), dtype=np.uint8)
+for num in range(1, 37):
+    COLORS[num] = RED if num in RED_NUMBERS else BLACK
+    PARITY[num] = ODD if num % 2 else EVEN
+    RANGES[num] = LOW if num <= 18 else HIGH
+    DOZENS[num] = (num - 1) // 12 + 1
+    COLUMNS[num] = (num - 1) % 3 + 1
+
+# Bets on the numbers between the zeros and the first row of each table type
+ZERO_BETS = {
+    "0": {
+        "split": [(ZERO, 1), (ZERO, 2), (ZERO, 3)],
+        "street": [(ZERO, 1, 2), (ZERO, 2, 3)],
+        "corner": [(ZERO, 1, 2, 3)],
+    },
+    "00": {
+        "split": [(ZERO, 1), (ZERO, 2), (DOUBLE_ZERO, 2), (DOUBLE_ZERO, 3), (ZERO, DOUBLE_ZERO)],
+        "street": [(ZERO, 1, 2), (ZERO, DOUBLE_ZERO, 2), (DOUBLE_ZERO, 2, 3)],
+        "five_number": [(ZERO, DOUBLE_ZERO, 1, 2, 3)],
+    },
+    "000": {
+        "split": [(ZERO, 1), (DOUBLE_ZERO, 2), (TRIPLE_ZERO, 3), (ZERO, DOUBLE_ZERO), (DOUBLE_ZERO, TRIPLE_ZERO)],
+        "street": [(ZERO, DOUBLE_ZERO, TRIPLE_ZERO)],
+    },
+}
+
+_LAYOUTS = {}  # One BetLayout per table type, shared by every wheel
+
+
+def pocket_code(number):
+    """
+    Turn a number as a player would write it into its pocket code.
+
+    Parameters:
+    - number (int | str): 0-36, or "0", "00", "000" or "1"-"36".
+
+    Returns:
+    - code (int | None): The pocket code, or None if it is not a pocket on any table.
+    """
+    if isinstance(number, str):
+        return POCKET_CODES.get(number)
+    if isinstance(number, (int, np.integer)) and not isinstance(number, bool) and 0 <= number <= 36:
+        return int(number)
+    return None
 
-class RouletteWheel:
+
+class BetLayout:
+    """
+    Every legal bet on one table type, indexed once so checks never rebuild lists.
+
+    Each bet is keyed by its type and a hashable form of its details, and maps to a row of
+    the coverage matrix: one uint8 flag per pocket code, set where the bet wins. Validating
+    a bet is one dictionary lookup, and settling any number of bets against a pocket is one
+    integer array index.
+
+    Parameters:
+    - table_type (str): '0', '00' or '000'.
+    """
 
     def __init__(self, table_type):
+        self.table_type = table_type
+
+        # Pocket codes on this table, and their attributes
+        self.pockets = np.arange(36 + len(table_type), dtype=np.uint8)
+        self.colors = COLORS[self.pockets]
+        self.parity = PARITY[self.pockets]
+        self.ranges = RANGES[self.pockets]
+
+        self.bets = {}
+        rows = []
+
+        def add(bet_type, details, covered):
+            row = np.zeros(self.pockets.size, dtype=np.uint8)
+            row[covered] = 1
+            self.bets[(bet_type, details)] = len(rows)
+            rows.append(row)
+
+        def add_group(bet_type, numbers):
+            add(bet_type, frozenset(numbers), list(numbers))
+
+        for code in self.pockets.tolist():
+            add("straight_up", code, [code])
+
+        for num in range(1, 37):
+            if num % 3:  # Not in the last column
+                add_group("split", (num, num + 1))
+            if num <= 33:
+                add_group("split", (num, num + 3))
+            if num % 3 and num <= 32:
+                add_group("corner", (num, num + 1, num + 3, num + 4))
+            if num % 3 == 1:
+                add_group("street", (num, num + 1, num + 2))
+                if num <= 31:
+                    add_group("line", range(num, num + 6))
+
+        for bet_type, groups in ZERO_BETS[table_type].items():
+            for numbers in groups:
+                if bet_type == "five_number":
+                    add(bet_type, None, list(numbers))
+                else:
+                    add_group(bet_type, numbers)
+
+        for group in (1, 2, 3):
+            add("column", group, COLUMNS[self.pockets] == group)
+            add("dozen", group, DOZENS[self.pockets] == group)
+
+        add("red_or_black", "red", self.colors == RED)
+        add("red_or_black", "black", self.colors == BLACK)
+        add("odd_or_even", "odd", self.parity == ODD)
+        add("odd_or_even", "even", self.parity == EVEN)
+        add("low_or_high", "low", self.ranges == LOW)
+        add("low_or_high", "high", self.ranges == HIGH)
+
+        self.coverage = np.stack(rows)
+
+    @staticmethod
+    def key(bet_type, details):
+        """
+        Turn a bet's details into the form the index is keyed on.
+
+        Numbers may be given as ints or strings, and groups of numbers in any order.
+
+        Returns:
+        - details: A hashable form of the details, or None if they have the wrong shape.
+        """
+        match bet_type:
+            case "straight_up":
+                return pocket_code(details)
+            case "split" | "street" | "corner" | "line":
+                if not isinstance(details, tuple):
+                    return None
+                codes = frozenset(pocket_code(num) for num in details)
+                return None if None in codes else codes
+            case _:
+                return details if isinstance(details, (int, str, type(None))) else None
+
+    def lookup(self, bet_type, details):
+        """
+        Find what a bet covers.
+
+        Returns:
+        - row (int | None): The bet's row in self.coverage, or None if the bet is not legal here.
+        """
+        return self.bets.get((bet_type, self.key(bet_type, details)))
+
+
+def get_layout(table_type):
+    """
+    Get the shared BetLayout for a table type, building it the first time.
+    """
+    if table_type not in _LAYOUTS:
+        _LAYOUTS[table_type] = BetLayout(table_type)
+    return _LAYOUTS[table_type]
+
+
+class RouletteWheel:
+    """
+    A roulette table that takes bets, spins and settles them.
+
+    Nothing is printed. Pass an event sink (see events.py) to record every bet, spin and
+    payout as typed records; without one, events are not built at all.
+
+    Spins come from a NumPy generator (see rng_streams.py). Single spins are served from a
+    buffer refilled in bulk, so spinning one at a time costs no generator call per spin.
+
+    Parameters:
+    - table_type (str): '0', '00' or '000'.
+    - events (EventSink): Where to send events. Defaults to None (no logging).
+    - rng: A seed, SeedSequence, RandomStreams or np.random.Generator. Defaults to fresh entropy.
+    - spin_buffer (int): Single spins drawn ahead at a time.
+    """
+
+    def __init__(self, table_type, events=None, rng=None, spin_buffer=4_096):
         legal_types = ['0', '00', '000']
         
         if table_type not in legal_types:
@@ -32,22 +223,18 @@ class RouletteWheel:
         else:
             self.payout_table["five_number"] = 6
 
-        # Define spaces (numbers + colors)
-        self.spaces = [
-            ("1", "red"), ("2", "black"), ("3", "red"), ("4", "black"),
-            ("5", "red"), ("6", "black"), ("7", "red"), ("8", "black"),
-            ("9", "red"), ("10", "black"), ("11", "black"), ("12", "red"),
-            ("13", "black"), ("14", "red"), ("15", "black"), ("16", "red"),
-            ("17", "black"), ("18", "red"), ("19", "red"), ("20", "black"),
-            ("21", "red"), ("22", "black"), ("23", "red"), ("24", "black"),
-            ("25", "red"), ("26", "black"), ("27", "red"), ("28", "black"),
-            ("29", "black"), ("30", "red"), ("31", "black"), ("32", "red"),
-            ("33", "black"), ("34", "red"), ("35", "black"), ("36", "red")
-        ]
-
-        # Add correct number of green spaces based on table type
-        for i in range(len(table_type)):  
-            self.spaces.append(("0" * (i + 1), "green"))
+        # Pockets are integer codes (see POCKET_NAMES), with their attributes in uint8 arrays
+        self.layout = get_layout(table_type)
+        self.spaces = self.layout.pockets
+        self.colors = self.layout.colors
+
+        self.bets = []
+        self.events = events
+        self.spin_count = 0  # Spins so far, which numbers the spin of every event
+
+        self.rng = as_generator(rng)
+        self._spin_buffer = np.empty(spin_buffer, dtype=np.uint8)
+        self._spin_position = spin_buffer  # Empty until the first spin
 
     def place_bet(self, bet_type, amount, details=None):
         """
@@ -61,6 +248,30 @@ class RouletteWheel:
         Returns:
         - None
         """
+        row = self._validate_bet(bet_type, amount, details)
+
+        # Add the bet to the list of bets
+        self.bets.append({
+            "bet_type": bet_type,
+            "amount": amount,
+            "details": details,
+            "row": row
+        })
+
+        if self.events is not None:
+            record = np.array([(self.spin_count, len(self.bets) - 1, BET_TYPE_CODES[bet_type], row, amount)], dtype=EVENT_DTYPES["bet"])
+            self.events.write("bet", record)
+
+    def _validate_bet(self, bet_type, amount, details):
+        """
+        Check a bet against the table's layout index.
+
+        Returns:
+        - row (int): The bet's row in self.layout.coverage.
+
+        Raises:
+        - ValueError: If the bet is not legal on this table.
+        """
         # Validate bet type
         if bet_type not in self.payout_table:
             raise ValueError(f"Invalid bet type: {bet_type}")
@@ -69,203 +280,165 @@ class RouletteWheel:
         if amount <= 0:
             raise ValueError("Bet amount must be greater than 0.")
 
-        # Use a match-case for better readability
-        match bet_type:
-            case "straight_up":
-                if details not in [num for num, _ in self.spaces]:
-                    raise ValueError("For 'straight_up' bets, details must be a valid number (e.g., '17').")
-
-            case "split":
-                if not isinstance(details, tuple) or len(details) != 2:
-                    raise ValueError("For 'split' bets, details must be a tuple of two adjacent numbers (e.g., (1, 2)).")
-                if not all(num in [num for num, _ in self.spaces] for num in details):
-                    raise ValueError("Each number in a 'split' bet must be valid numbers on the wheel.")
-
-            case "street":
-                if not isinstance(details, tuple) or len(details) != 3:
-                    raise ValueError("For 'street' bets, details must be a tuple of three numbers in the same row.")
-                rows = [
-                    [1, 2, 3], [4, 5, 6], [7, 8, 9], [10, 11, 12],
-                    [13, 14, 15], [16, 17, 18], [19, 20, 21],
-                    [22, 23, 24], [25, 26, 27], [28, 29, 30],
-                    [31, 32, 33], [34, 35, 36]
-                ]
-                if details not in rows:
-                    raise ValueError(f"Invalid 'street' bet. Must be a row of three numbers (e.g., (1, 2, 3)).")
-
-            case "corner":
-                if not isinstance(details, tuple) or len(details) != 4:
-                    raise ValueError("For 'corner' bets, details must be a tuple of four numbers in a square.")
-                squares = [
-                    [1, 2, 4, 5], [2, 3, 5, 6], [4, 5, 7, 8], [5, 6, 8, 9],
-                    # Extend this to include all valid corner groups
-                ]
-                if sorted(details) not in squares:
-                    raise ValueError(f"Invalid 'corner' bet. Must be four numbers in a square (e.g., (1, 2, 4, 5)).")
-
-            case "line":
-                if not isinstance(details, tuple) or len(details) != 6:
-                    raise ValueError("For 'line' bets, details must be a tuple of six numbers in two rows.")
-                lines = [
-                    [1, 2, 3, 4, 5, 6], [7, 8, 9, 10, 11, 12],
-                    # Extend to include all valid lines
-                ]
-                if sorted(details) not in lines:
-                    raise ValueError(f"Invalid 'line' bet. Must be six numbers in two rows (e.g., (1, 2, 3, 4, 5, 6)).")
-
-            case "column":
-                if details not in [1, 2, 3]:
-                    raise ValueError("For 'column' bets, details must be 1, 2, or 3 (for the respective column).")
-
-            case "dozen":
-                if details not in [1, 2, 3]:
-                    raise ValueError("For 'dozen' bets, details must be 1 (1-12), 2 (13-24), or 3 (25-36).")
-
-            case "red_or_black" | "odd_or_even" | "low_or_high":
-                valid_details = {
-                    "red_or_black": ["red", "black"],
-                    "odd_or_even": ["odd", "even"],
-                    "low_or_high": ["low", "high"]
-                }
-                if details not in valid_details[bet_type]:
-                    raise ValueError(f"For '{bet_type}' bets, details must be one of {valid_details[bet_type]}.")
-
-            case "five_number":
-                if self.table_type != "00":
-                    raise ValueError("The 'five_number' bet is only valid on American roulette tables.")
-                if details is not None:
-                    raise ValueError("The 'five_number' bet does not require details.")
+        row = self.layout.lookup(bet_type, details)
+        if row is None:
+            messages = {
+                "straight_up": "For 'straight_up' bets, details must be a valid number (e.g., '17').",
+                "split": "For 'split' bets, details must be a tuple of two adjacent numbers (e.g., (1, 2)).",
+                "street": "Invalid 'street' bet. Must be a row of three numbers (e.g., (1, 2, 3)).",
+                "corner": "Invalid 'corner' bet. Must be four numbers in a square (e.g., (1, 2, 4, 5)).",
+                "line": "Invalid 'line' bet. Must be six numbers in two rows (e.g., (1, 2, 3, 4, 5, 6)).",
+                "column": "For 'column' bets, details must be 1, 2, or 3 (for the respective column).",
+                "dozen": "For 'dozen' bets, details must be 1 (1-12), 2 (13-24), or 3 (25-36).",
+                "red_or_black": "For 'red_or_black' bets, details must be one of ['red', 'black'].",
+                "odd_or_even": "For 'odd_or_even' bets, details must be one of ['odd', 'even'].",
+                "low_or_high": "For 'low_or_high' bets, details must be one of ['low', 'high'].",
+                "five_number": "The 'five_number' bet does not require details.",
+            }
+            raise ValueError(messages[bet_type])
 
-            case _:
-                raise ValueError(f"Unrecognized bet type: {bet_type}")
+        return row
 
-        # Add the bet to the list of bets
-        self.bets.append({
-            "bet_type": bet_type,
-            "amount": amount,
-            "details": details
-        })
+    def payout_matrix(self, bets):
+        """
+        Build the net result of every bet for every space the ball can land in.
+
+        Parameters:
+        - bets (list): Bets as dicts like those in self.bets, or (bet_type, amount, details) tuples.
 
-        print(f"Bet placed: {bet_type} | Amount: {amount} | Details: {details}")
+        Returns:
+        - matrix (np.ndarray): Shape (len(self.spaces), len(bets)). Entry [s, b] is what bet b wins
+          (amount * payout) or loses (-amount) when the ball lands on pocket code s.
+        """
+        rows = np.empty(len(bets), dtype=np.intp)
+        amounts = np.empty(len(bets))
+        payouts = np.empty(len(bets))
+
+        for column, bet in enumerate(bets):
+            if isinstance(bet, dict):
+                bet_type, amount, details = bet["bet_type"], bet["amount"], bet["details"]
+            else:
+                bet_type, amount, details = bet
+            rows[column] = self._validate_bet(bet_type, amount, details)
+            amounts[column] = amount
+            payouts[column] = self.payout_table[bet_type]
+
+        return np.where(self.layout.coverage[rows].T == 1, amounts * payouts, -amounts)
+
+    def simulate(self, n_spins, bets=None, seed=None, per_spin=False, chunk_size=10_000_000):
+        """
+        Simulate many spins against a slate of bets at once.
+
+        All spins are drawn with NumPy and every bet's result comes from one lookup into
+        the payout matrix, so there is no per-spin Python work. With an event sink attached,
+        every spin and every bet's result on it are sent as one batch per chunk.
+
+        Parameters:
+        - n_spins (int): Number of spins.
+        - bets (list): Bets as accepted by payout_matrix(). Defaults to self.bets.
+        - seed: Anything rng_streams.as_generator() accepts, for reproducible runs. Defaults to the wheel's own generator.
+        - per_spin (bool): Also return every bet's result on every spin (n_bets * n_spins floats).
+        - chunk_size (int): Spins drawn at a time when per_spin is False, which bounds memory.
+
+        Returns:
+        - results (dict):
+            'spins'   : How many times the ball landed on each pocket (np.ndarray, indexed by pocket code)
+            'pnl'     : Total net result of each bet (np.ndarray)
+            'per_spin': Only when per_spin is True, net result of each bet on each spin (np.ndarray, shape (n_bets, n_spins))
+        """
+        bets = self.bets if bets is None else bets
+        matrix = self.payout_matrix(bets)
+        rng = self.rng if seed is None else as_generator(seed)
+        n_spaces = len(self.spaces)
+
+        if per_spin:
+            spins = rng.integers(0, n_spaces, size=n_spins, dtype=np.uint8)
+            counts = np.bincount(spins, minlength=n_spaces)
+            self._record_spins(spins, matrix)
+            return {
+                "spins": counts,
+                "pnl": counts @ matrix,
+                "per_spin": matrix[spins].T,
+            }
 
+        counts = np.zeros(n_spaces, dtype=np.int64)
+        buffer = np.empty(min(chunk_size, n_spins), dtype=np.uint8)
+        for start in range(0, n_spins, chunk_size):
+            spins = fill_integers(rng, n_spaces, buffer[:min(chunk_size, n_spins - start)])
+            counts += np.bincount(spins, minlength=n_spaces)
+            self._record_spins(spins, matrix)
+
+        return {
+            "spins": counts,
+            "pnl": counts @ matrix,
+        }
+
+    def _record_spins(self, spins, matrix):
+        """
+        Count a batch of simulated spins and send them, and every bet's result on them, to the event sink.
+        """
+        first = self.spin_count
+        self.spin_count += spins.size
+        if self.events is None:
+            return
+
+        records = np.empty(spins.size, dtype=EVENT_DTYPES["spin"])
+        records["spin"] = np.arange(first, first + spins.size)
+        records["pocket"] = spins
+        self.events.write("spin", records)
+
+        n_bets = matrix.shape[1]
+        if n_bets:
+            payouts = np.empty(spins.size * n_bets, dtype=EVENT_DTYPES["payout"])
+            payouts["spin"] = np.repeat(records["spin"], n_bets)
+            payouts["bet"] = np.tile(np.arange(n_bets, dtype=np.uint32), spins.size)
+            payouts["net"] = matrix[spins].ravel()
+            self.events.write("payout", payouts)
 
     def spin_wheel(self):
         """
         Simulate a spin of the roulette wheel.
 
         Returns:
-        - winning_number (str): The winning number (as a string).
-        - winning_color (str): The color of the winning number (red/black/green).
+        - winning_pocket (int): The winning pocket code (see POCKET_NAMES).
+        - winning_color (int): The color code of the winning pocket (GREEN, RED or BLACK).
         """
-        # Randomly choose a space (index) from the wheel
-        winning_space = choice(self.spaces)
-        winning_number, winning_color = winning_space
-        print(f"The winning number is {winning_number} ({winning_color})")
+        # Randomly choose a pocket from the wheel
+        if self._spin_position == self._spin_buffer.size:
+            fill_integers(self.rng, len(self.spaces), self._spin_buffer)
+            self._spin_position = 0
+        winning_pocket = int(self._spin_buffer[self._spin_position])
+        self._spin_position += 1
+        winning_color = self.colors[winning_pocket]
+
+        if self.events is not None:
+            self.events.write("spin", np.array([(self.spin_count, winning_pocket)], dtype=EVENT_DTYPES["spin"]))
+        self.spin_count += 1
 
-        return winning_number, winning_color
+        return winning_pocket, winning_color
 
     def resolve_bets(self):
         """
         Resolve all the bets placed on the wheel.
 
         Returns:
-        - None
+        - results (np.ndarray): Net result of each bet in self.bets: amount * payout for a win, -amount for a loss.
         """
         # Spin the wheel and get the result
-        winning_number, winning_color = self.spin_wheel()
-
-        for bet in self.bets:
-            bet_type = bet["bet_type"]
-            amount = bet["amount"]
-            details = bet["details"]
-            
-            # Resolve each bet type
-            match bet_type:
-                case "straight_up":
-                    if details == winning_number:
-                        payout = self.payout_table["straight_up"]
-                        winnings = amount * payout
-                        print(f"Straight-up bet on {details} wins! Payout: {winnings}")
-                    else:
-                        print(f"Straight-up bet on {details} loses.")
-                
-                case "split":
-                    if details[0] == winning_number or details[1] == winning_number:
-                        payout = self.payout_table["split"]
-                        winnings = amount * payout
-                        print(f"Split bet on {details} wins! Payout: {winnings}")
-                    else:
-                        print(f"Split bet on {details} loses.")
-                
-                case "street":
-                    if winning_number in details:
-                        payout = self.payout_table["street"]
-                        winnings = amount * payout
-                        print(f"Street bet on {details} wins! Payout: {winnings}")
-                    else:
-                        print(f"Street bet on {details} loses.")
-                
-                case "corner":
-                    if sorted(details) == sorted([winning_number, winning_number + 1, winning_number + 2, winning_number + 3]):
-                        payout = self.payout_table["corner"]
-                        winnings = amount * payout
-                        print(f"Corner bet on {details} wins! Payout: {winnings}")
-                    else:
-                        print(f"Corner bet on {details} loses.")
-                
-                case "line":
-                    if winning_number in details:
-                        payout = self.payout_table["line"]
-                        winnings = amount * payout
-                        print(f"Line bet on {details} wins! Payout: {winnings}")
-                    else:
-                        print(f"Line bet on {details} loses.")
-                
-                case "column":
-                    if (details == 1 and int(winning_number) % 3 == 1) or (details == 2 and int(winning_number) % 3 == 2) or (details == 3 and int(winning_number) % 3 == 0):
-                        payout = self.payout_table["column"]
-                        winnings = amount * payout
-                        print(f"Column bet on {details} wins! Payout: {winnings}")
-                    else:
-                        print(f"Column bet on {details} loses.")
-                
-                case "dozen":
-                    if (details == 1 and 1 <= int(winning_number) <= 12) or (details == 2 and 13 <= int(winning_number) <= 24) or (details == 3 and 25 <= int(winning_number) <= 36):
-                        payout = self.payout_table["dozen"]
-                        winnings = amount * payout
-                        print(f"Dozen bet on {details} wins! Payout: {winnings}")
-                    else:
-                        print(f"Dozen bet on {details} loses.")
-                
-                case "red_or_black":
-                    if winning_color == details:
-                        payout = self.payout_table["red_or_black"]
-                        winnings = amount * payout
-                        print(f"Red/Black bet on {details} wins! Payout: {winnings}")
-                    else:
-                        print(f"Red/Black bet on {details} loses.")
-                
-                case "odd_or_even":
-                    if (winning_number % 2 == 1 and details == "odd") or (winning_number % 2 == 0 and details == "even"):
-                        payout = self.payout_table["odd_or_even"]
-                        winnings = amount * payout
-                        print(f"Odd/Even bet on {details} wins! Payout: {winnings}")
-                    else:
-                        print(f"Odd/Even bet on {details} loses.")
-                
-                case "low_or_high":
-                    if (1 <= int(winning_number) <= 18 and details == "low") or (19 <= int(winning_number) <= 36 and details == "high"):
-                        payout = self.payout_table["low_or_high"]
-                        winnings = amount * payout
-                        print(f"Low/High bet on {details} wins! Payout: {winnings}")
-                    else:
-                        print(f"Low/High bet on {details} loses.")
-                
-                case "five_number":
-                    if self.table_type == "00" and winning_number in ['0', '00', '1', '2', '3']:
-                        payout = self.payout_table["five_number"]
-                        winnings = amount * payout
-                        print(f"Five-number bet wins! Payout: {winnings}")
-                    else:
-                        print(f"Five-number bet loses.")
-                        
\ No newline at end of file
+        spin = self.spin_count
+        winning_pocket, _ = self.spin_wheel()
+        rows = [bet["row"] for bet in self.bets]
+        won = self.layout.coverage[rows, winning_pocket] == 1
+
+        amounts = np.array([bet["amount"] for bet in self.bets], dtype=float)
+        payouts = np.array([self.payout_table[bet["bet_type"]] for bet in self.bets], dtype=float)
+        results = np.where(won, amounts * payouts, -amounts)
+
+        if self.events is not None and self.bets:
+            records = np.empty(len(self.bets), dtype=EVENT_DTYPES["payout"])
+            records["spin"] = spin
+            records["bet"] = np.arange(len(self.bets))
+            records["net"] = results
+            self.events.write("payout", records)
+
+        return results
@@ -0,0 +1,83 @@
+'''Timing of link extraction on saved pages'''
+
+import asyncio, os, sys
+from statistics import median
+from time import perf_counter
+from urllib.parse import quote, unquote
+from bs4 import BeautifulSoup # type: ignore
+import tools
+from scraping import extract_links
+
+CONFIG = tools.initialize_configs()
+
+def legacy_extract_links(CONFIG: dict, html: str, page: str) -> list:
+    '''Original version, kept for comparison.'''
+    soup = BeautifulSoup(html, 'html.parser')
+
+    links = []
+
+    for tag in soup.find_all('a', href=True):
+        href = tag['href'] # /wiki/[link]
+        if href.startswith('/wiki/') and ':' not in href and '#' not in href and "List_of_" not in href and "disambiguation" not in href: # links and not namespaces or lists
+            href = href[6:]
+            if href not in CONFIG['global_pages'] and href != page:
+                links.append(href)
+
+    return list(dict.fromkeys(links))
+
+def save_fixtures(pages: list[str], directory: str = 'fixtures', base_url: str = 'https://en.wikipedia.org/wiki/') -> None:
+    '''Download pages once and save their html, named by the quoted page title'''
+    from crawler import Crawler
+
+    async def fetch_all() -> list:
+        async with Crawler(CONFIG, base_url=base_url, concurrency=2, rate=1.0) as crawler:
+            return await asyncio.gather(*(crawler.fetch(page) for page in pages))
+
+    os.makedirs(directory, exist_ok=True)
+    for page, html in zip(pages, asyncio.run(fetch_all())):
+        if html is not None:
+            with open(os.path.join(directory, f"{quote(page, safe='')}.html"), 'w', encoding='utf-8') as file:
+                file.write(html)
+
+def benchmark_extraction(directory: str = 'fixtures', runs: int = 5) -> bool:
+    '''Time both extractors on every saved page and check they find exactly the same links, in the same order'''
+    fixtures = {}
+    for file_name in sorted(os.listdir(directory)):
+        if file_name.endswith('.html'):
+            with open(os.path.join(directory, file_name), 'r', encoding='utf-8') as file:
+                fixtures[unquote(file_name[:-5])] = file.read()
+
+    if not fixtures:
+        print(f"No .html fixtures in {directory}")
+        return False
+
+    identical = True
+    legacy_total, new_total = 0.0, 0.0
+    print(f"{'Page':<40}{'Links':>8}{'Original':>12}{'New':>12}{'Speedup':>10}")
+    for page, html in fixtures.items():
+        legacy_links, new_links = legacy_extract_links(CONFIG, html, page), extract_links(CONFIG, html, page)
+        if legacy_links != new_links:
+            identical = False
+            print(f"{page}: links differ, {len(set(legacy_links) - set(new_links))} missing and {len(set(new_links) - set(legacy_links))} extra")
+
+        legacy_time = median(time_call(legacy_extract_links, CONFIG, html, page) for _ in range(runs))
+        new_time = median(time_call(extract_links, CONFIG, html, page) for _ in range(runs))
+        legacy_total += legacy_time
+        new_total += new_time
+        print(f"{page[:39]:<40}{len(new_links):>8}{legacy_time:>11.4f}s{new_time:>11.4f}s{legacy_time / new_time:>9.1f}x")
+
+    print(f"{'Total':<40}{'':>8}{legacy_total:>11.4f}s{new_total:>11.4f}s{legacy_total / new_total:>9.1f}x")
+    print('Identical links' if identical else 'Links differ')
+    return identical
+
+def time_call(function, *args) -> float:
+    start = perf_counter()
+    function(*args)
+    return perf_counter() - start
+
+
+if __name__ == '__main__':
+    # Any page titles given are downloaded as fixtures first, e.g. python benchmark.py Python_(programming_language) Moon
+    if sys.argv[1:]:
+        save_fixtures(sys.argv[1:])
+    sys.exit(0 if benchmark_extraction() else 1)
@@ -0,0 +1,136 @@
+'''Concurrent, rate limited fetching of pages from wikipedia'''
+
+import asyncio
+from email.utils import parsedate_to_datetime
+from datetime import datetime, timezone
+import aiohttp
+from scraping import extract_links
+
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+class TokenBucket:
+    '''
+    Lets through rate requests per second on average and bursts of up to capacity,
+    shared by every fetch of a crawler. pause() holds everyone back, e.g. after a 429
+    '''
+
+    def __init__(self, rate: float, capacity: float = None):
+        if rate <= 0:
+            raise ValueError("Rate must be greater than 0.")
+        self.rate = rate
+        self.capacity = capacity or max(1.0, rate)
+        self.tokens = self.capacity
+        self.updated = None
+        self.resume = 0.0
+        self.lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        # Waiters queue on the lock, so tokens are handed out first come first served
+        async with self.lock:
+            loop = asyncio.get_running_loop()
+            while True:
+                now = loop.time()
+                if now < self.resume:
+                    await asyncio.sleep(self.resume - now)
+                    continue
+
+                if self.updated is not None:
+                    self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+
+    def pause(self, seconds: float) -> None:
+        self.resume = max(self.resume, asyncio.get_running_loop().time() + seconds)
+
+def retry_after(value: str | None) -> float | None:
+    '''Seconds to wait from a Retry-After header, given either as seconds or as an HTTP date'''
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, (parsedate_to_datetime(value) - datetime.now(timezone.utc)).total_seconds())
+    except (TypeError, ValueError):
+        return None
+
+class Crawler:
+    '''
+    Fetches pages over one pooled keep-alive session, with at most concurrency requests
+    in flight, all drawing from one token bucket. Failed requests are retried with
+    exponential backoff, waiting at least as long as the server's Retry-After asks.
+    Use it as an async context manager so the session is opened and closed
+
+    base_url can point at any server, such as a local stub for testing
+    '''
+
+    def __init__(self, CONFIG: dict, base_url: str = 'https://en.wikipedia.org/wiki/', concurrency: int = 8, rate: float = 10.0,
+                 burst: float = None, retries: int = 5, backoff: float = 0.5, max_backoff: float = 60.0, timeout: float = 30.0, debug: bool = False):
+        self.CONFIG = CONFIG
+        self.base_url = base_url
+        self.concurrency = concurrency
+        self.bucket = TokenBucket(rate, burst)
+        self.retries = retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.timeout = timeout
+        self.debug = debug
+        self.semaphore = asyncio.Semaphore(concurrency)
+        self.session = None
+
+    async def __aenter__(self) -> 'Crawler':
+        connector = aiohttp.TCPConnector(limit=self.concurrency, keepalive_timeout=60)
+        self.session = aiohttp.ClientSession(connector=connector, timeout=aiohttp.ClientTimeout(total=self.timeout))
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.session.close()
+        self.session = None
+
+    async def fetch(self, page: str) -> str | None:
+        '''Return a page's html, or None if it does not exist or every retry failed'''
+        async with self.semaphore:
+            for attempt in range(self.retries + 1):
+                await self.bucket.acquire()
+                delay = min(self.max_backoff, self.backoff * 2 ** attempt)
+                try:
+                    async with self.session.get(self.base_url + page) as response:
+                        if response.status == 200:
+                            return await response.text()
+                        if response.status not in RETRY_STATUSES:
+                            if self.debug:
+                                print(f"Got {response.status} for {page}")
+                            return None
+
+                        wait = retry_after(response.headers.get('Retry-After'))
+                        if wait is not None:
+                            delay = max(delay, wait)
+                        if response.status == 429:
+                            self.bucket.pause(delay)  # Every fetch is slowed down, not just this one
+                        if self.debug:
+                            print(f"Got {response.status} for {page}, retrying in {delay:0.2f}s")
+                except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                    if self.debug:
+                        print(f"Request for {page} failed ({e!r}), retrying in {delay:0.2f}s")
+
+                if attempt < self.retries:
+                    await asyncio.sleep(delay)
+
+        print(f"An error has occurred: gave up on {page} after {self.retries + 1} attempts")
+        return None
+
+    async def scrape(self, page: str) -> list | None:
+        '''Return list of links on page, or None if it could not be fetched'''
+        html = await self.fetch(page)
+        if html is None:
+            return None
+        return extract_links(self.CONFIG, html, page)
+
+    async def scrape_many(self, pages: list[str]) -> dict:
+        '''Scrape pages concurrently, returning page: links for every page fetched'''
+        results = await asyncio.gather(*(self.scrape(page) for page in pages))
+        return {page: links for page, links in zip(pages, results) if links is not None}
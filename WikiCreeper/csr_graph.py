@@ -0,0 +1,153 @@
+'''Compact compressed sparse row graph of pages, for pathing without loading links as Python objects'''
+
+import os, sqlite3
+import numpy as np
+import tools
+
+CONFIG = tools.initialize_configs()
+
+# Files a saved graph is made of; every one is a plain .npy so it can be memory mapped
+FILES = ('offsets', 'targets', 'title_offsets', 'title_bytes')
+
+class CSRGraph:
+    '''
+    Pages are numbered 0 to n - 1 in sorted title order. The links of page i are
+    targets[offsets[i]:offsets[i + 1]], and its title is the UTF-8 bytes
+    title_bytes[title_offsets[i]:title_offsets[i + 1]], so a title's id is found
+    by binary search and nothing has to be built after loading
+    '''
+
+    def __init__(self, offsets: np.ndarray, targets: np.ndarray, title_offsets: np.ndarray, title_bytes: np.ndarray):
+        self.offsets = offsets
+        self.targets = targets
+        self.title_offsets = title_offsets
+        self.title_bytes = title_bytes
+
+    @classmethod
+    def from_edges(cls, titles: list[str], sources: np.ndarray, targets: np.ndarray) -> 'CSRGraph':
+        '''Build a graph from titles and the (source, target) positions in titles of every link'''
+        titles = list(titles)
+        order = sorted(range(len(titles)), key=titles.__getitem__)
+        ids = np.empty(len(titles), dtype=np.int32)
+        ids[order] = np.arange(len(titles), dtype=np.int32)
+
+        sources = ids[np.asarray(sources, dtype=np.int64)]
+        targets = ids[np.asarray(targets, dtype=np.int64)]
+        edge_order = np.lexsort((targets, sources))
+        offsets = np.zeros(len(titles) + 1, dtype=np.int64)
+        np.cumsum(np.bincount(sources, minlength=len(titles)), out=offsets[1:])
+
+        encoded = [titles[i].encode('utf-8') for i in order]
+        title_offsets = np.zeros(len(titles) + 1, dtype=np.int64)
+        np.cumsum([len(title) for title in encoded], out=title_offsets[1:])
+        title_bytes = np.frombuffer(b''.join(encoded), dtype=np.uint8)
+
+        return cls(offsets, targets[edge_order], title_offsets, title_bytes)
+
+    @classmethod
+    def from_dict(cls, graph: dict) -> 'CSRGraph':
+        '''Build a graph from a dict of title to list of linked titles, such as make_dict() returns'''
+        ids = {title: i for i, title in enumerate(graph)}
+        for links in graph.values():
+            for link in links:
+                ids.setdefault(link, len(ids))
+
+        sources = np.repeat(np.arange(len(graph)), [len(links) for links in graph.values()])
+        targets = np.fromiter((ids[link] for links in graph.values() for link in links), dtype=np.int64, count=len(sources))
+        return cls.from_edges(list(ids), sources, targets)
+
+    @classmethod
+    def from_database(cls, database_name: str = CONFIG['database_file'], chunk_size: int = 1 << 16) -> 'CSRGraph':
+        '''Build a graph straight from the titles and edges tables, reading links in chunks of integer pairs'''
+        try:
+            conn = sqlite3.connect(database_name)
+            cursor = conn.cursor()
+
+            cursor.execute('SELECT id, title FROM titles ORDER BY id;')
+            rows = cursor.fetchall()
+            row_ids = np.fromiter((id for id, _ in rows), dtype=np.int64, count=len(rows))
+            titles = [title for _, title in rows]
+
+            cursor.execute('SELECT src_id, dst_id FROM edges;')
+            chunks = [np.empty((0, 2), dtype=np.int64)]
+            while chunk := cursor.fetchmany(chunk_size):
+                chunks.append(np.array(chunk, dtype=np.int64))
+            edges = np.concatenate(chunks)
+        except sqlite3.Error as e:
+            raise ValueError(f"Could not read graph from: {database_name}") from e
+        finally:
+            conn.close()
+
+        # Database ids can have gaps, so links are mapped to positions in titles
+        return cls.from_edges(titles, np.searchsorted(row_ids, edges[:, 0]), np.searchsorted(row_ids, edges[:, 1]))
+
+    def save(self, directory: str) -> None:
+        '''Write the graph's arrays to a directory as .npy files'''
+        try:
+            os.makedirs(directory, exist_ok=True)
+            for name in FILES:
+                np.save(os.path.join(directory, f'{name}.npy'), getattr(self, name))
+        except OSError as e:
+            raise ValueError(f"Could not write graph to: {directory}") from e
+
+    @classmethod
+    def load(cls, directory: str, mmap: bool = True) -> 'CSRGraph':
+        '''Read a graph written by save(); mapped files are only paged in as the search touches them'''
+        try:
+            return cls(*(np.load(os.path.join(directory, f'{name}.npy'), mmap_mode='r' if mmap else None) for name in FILES))
+        except (OSError, ValueError) as e:
+            raise ValueError(f"Could not read graph from: {directory}") from e
+
+    def __len__(self) -> int:
+        return len(self.offsets) - 1
+
+    def title(self, page: int) -> str:
+        return self.title_bytes[self.title_offsets[page]:self.title_offsets[page + 1]].tobytes().decode('utf-8')
+
+    def index(self, title: str) -> int | None:
+        '''The id of a title, or None if the graph has never seen it'''
+        encoded = title.encode('utf-8')
+        low, high = 0, len(self)
+        while low < high:
+            middle = (low + high) // 2
+            if self.title_bytes[self.title_offsets[middle]:self.title_offsets[middle + 1]].tobytes() < encoded:
+                low = middle + 1
+            else:
+                high = middle
+
+        return low if low < len(self) and self.title(low) == title else None
+
+    def links(self, page: int) -> np.ndarray:
+        return self.targets[self.offsets[page]:self.offsets[page + 1]]
+
+    def bfs(self, start_page: str, goal_page: str, debug: bool = False) -> list:
+        '''Shortest path of titles from start_page to goal_page, expanding a whole level of the search at once'''
+        start, goal = self.index(start_page), self.index(goal_page)
+        if start is None or goal is None:
+            return []
+
+        parents = np.full(len(self), -1, dtype=np.int32)
+        parents[start] = start
+        frontier = np.array([start], dtype=np.int64)
+
+        while frontier.size and parents[goal] == -1:
+            # Gather every link out of the frontier in one go, remembering which page each came from
+            starts = self.offsets[frontier]
+            counts = self.offsets[frontier + 1] - starts
+            positions = np.arange(counts.sum()) + np.repeat(starts - np.cumsum(counts) + counts, counts)
+            links = self.targets[positions]
+            sources = np.repeat(frontier, counts)
+
+            unseen = parents[links] == -1
+            frontier, first = np.unique(links[unseen], return_index=True)
+            parents[frontier] = sources[unseen][first]
+            if debug:
+                print(f"Visited {len(frontier)} new pages")
+
+        if parents[goal] == -1:
+            return []
+
+        path = [goal]
+        while path[-1] != start:
+            path.append(int(parents[path[-1]]))
+        return [self.title(page) for page in reversed(path)]
@@ -1,31 +1,91 @@
 import sqlite3, tools, os, scraping
-from collections import Counter
 
 CONFIG = tools.initialize_configs()
 
+# Pages get integer ids and each link is one row, indexed from both ends so lookups in either direction never scan the table
+TABLES = [
+    """
+    CREATE TABLE IF NOT EXISTS titles (
+        id INTEGER PRIMARY KEY,
+        title TEXT NOT NULL UNIQUE,
+        logged INTEGER NOT NULL DEFAULT 0
+    );
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS edges (
+        src_id INTEGER NOT NULL,
+        dst_id INTEGER NOT NULL,
+        PRIMARY KEY (src_id, dst_id)
+    ) WITHOUT ROWID;
+    """,
+]
+INDEXES = [
+    "CREATE INDEX IF NOT EXISTS edges_by_dst ON edges (dst_id, src_id);",
+]
+
 def create_table(database_name: str = CONFIG['database_file']):
     try:
         conn = sqlite3.connect(database_name)
         cursor = conn.cursor()
-        create_table_query = """
-        CREATE TABLE IF NOT EXISTS pages (
-            page_name VARCHAR PRIMARY KEY,
-            links STRING
-        );
-        """
-
-        cursor.execute(create_table_query)
-
+        for statement in TABLES + INDEXES:
+            cursor.execute(statement)
         conn.commit()
     except sqlite3.Error as e:
         print(f"An error occurred: {e}")
     finally:
         conn.close()
 
+def migrate_database(database_name: str = CONFIG['database_file'], drop_pages: bool = True, verbose: bool = True) -> None:
+    '''Convert an old pages table of pipe-packed links to the titles and edges tables in one transaction'''
+    try:
+        # Transactions are managed here, so the table and index changes roll back with the rows if anything fails
+        conn = sqlite3.connect(database_name, isolation_level=None)
+        cursor = conn.cursor()
+        cursor.execute('BEGIN;')
+
+        cursor.execute('SELECT page_name, links FROM pages;')
+        pages = [(page_name, unpack_list(links or '')) for page_name, links in cursor.fetchall()]
+
+        # Ids are handed out here so every row goes in with one executemany, and the reverse index is built after the bulk load
+        for statement in TABLES:
+            cursor.execute(statement)
+        cursor.execute('DROP INDEX IF EXISTS edges_by_dst;')
+        cursor.execute('SELECT title, id FROM titles;')
+        ids = dict(cursor.fetchall())
+        next_id = max(ids.values(), default=0) + 1
+        new_titles = []
+        for page_name, links in pages:
+            for title in (page_name, *links):
+                if title not in ids:
+                    ids[title] = next_id
+                    new_titles.append((next_id, title))
+                    next_id += 1
+
+        cursor.executemany('INSERT INTO titles (id, title) VALUES (?, ?);', new_titles)
+        cursor.executemany('UPDATE titles SET logged = 1 WHERE id = ?;', ((ids[page_name],) for page_name, _ in pages))
+        cursor.executemany('INSERT OR IGNORE INTO edges (src_id, dst_id) VALUES (?, ?);',
+                           ((ids[page_name], ids[link]) for page_name, links in pages for link in links))
+        for statement in INDEXES:
+            cursor.execute(statement)
+        if drop_pages:
+            cursor.execute('DROP TABLE pages;')
+
+        cursor.execute('COMMIT;')
+        if verbose:
+            print(f"Migrated {len(pages)} pages, {len(ids)} titles and {sum(len(links) for _, links in pages)} links")
+    except sqlite3.Error as e:
+        if conn.in_transaction:
+            cursor.execute('ROLLBACK;')
+        print(f"An error occurred: {e}")
+    finally:
+        conn.close()
+
 def populate_from_csv(database_name: str = CONFIG['database_file'], csv_source: str = CONFIG['master_memory']):
-    csv_source = tools.read_file()
+    csv_source = tools.read_file(csv_source)
+    conn = create_connection(database_name)
     for key in csv_source.keys():
-        insert_page(key, csv_source[key], database_name)
+        insert_page(key, csv_source[key], conn)
+    conn.close()
 
 def pack_list(lst: list) -> str:
     return '|'.join(str(item) for item in lst)
@@ -36,13 +96,15 @@ def unpack_list(string: str) -> list[str]:
     return list_
     
 def insert_page(page_name: str, links: list, connection, debug:bool = False) -> None:
-    insert_query = "INSERT OR REPLACE INTO pages (page_name, links) VALUES (?, ?);"
     try:
-        links_packed = pack_list(links)
-
         cursor = connection.cursor()
 
-        cursor.execute(insert_query, (page_name, links_packed))
+        cursor.executemany("INSERT OR IGNORE INTO titles (title) VALUES (?);", ((title,) for title in (page_name, *links)))
+        cursor.execute("UPDATE titles SET logged = 1 WHERE title = ?;", (page_name,))
+        cursor.execute("DELETE FROM edges WHERE src_id = (SELECT id FROM titles WHERE title = ?);", (page_name,))
+        cursor.executemany(
+            "INSERT OR IGNORE INTO edges (src_id, dst_id) SELECT src.id, dst.id FROM titles src, titles dst WHERE src.title = ? AND dst.title = ?;",
+            ((page_name, link) for link in links))
 
         connection.commit()
         if debug:
@@ -54,15 +116,16 @@ def retrieve_links(page_name: str, connection) -> list:
     try:
         cursor = connection.cursor()
         select_query = '''
-        SELECT links
-        FROM pages
-        WHERE page_name = ?;
+        SELECT dst.title
+        FROM titles src
+        JOIN edges ON edges.src_id = src.id
+        JOIN titles dst ON dst.id = edges.dst_id
+        WHERE src.title = ?;
         '''
 
         cursor.execute(select_query, (page_name,))
         
-        links_packed = cursor.fetchone()[0]
-        links = unpack_list(links_packed)
+        links = [title for title, in cursor.fetchall()]
 
         return links
 
@@ -82,7 +145,7 @@ def database_analysis(database_name: str = CONFIG['database_file']) -> dict:
         cursor = conn.cursor()
         data = {}
 
-        get_size = 'SELECT COUNT(*) FROM pages;'
+        get_size = 'SELECT COUNT(*) FROM titles WHERE logged;'
         cursor.execute(get_size)
         data['count'] = cursor.fetchone()[0]
 
@@ -111,30 +174,30 @@ def adv_database_analysis(database_name: str = CONFIG['database_file'], verbose:
         cursor = conn.cursor()
         data = {}
 
-        get_size = 'SELECT COUNT(*) FROM pages;'
+        get_size = 'SELECT COUNT(*) FROM titles WHERE logged;'
         cursor.execute(get_size)
         data['count'] = cursor.fetchone()[0]
 
-        get_links = 'SELECT links FROM pages;'
-        get_paired_page = 'SELECT page_name FROM pages WHERE links = ?'
-        cursor.execute(get_links)
-        links_unique = set()
-        links =[]
-        data['most_links'] =('', 0)
-        all_links = cursor.fetchall()
-        for string in all_links:
-            help_links = unpack_list(string[0])
-            links.extend(help_links)
-            links_unique.update(help_links)
-            if len(help_links) > data['most_links'][1]:
-                cursor.execute(get_paired_page, (string[0],))
-                data['most_links'] = (cursor.fetchone()[0], len(help_links))
-
-        data['visits'] = len(links_unique)
-        data['average_links'] = len(links) / data['count']
-
-        counter = Counter(links)
-        data['most_common'] = counter.most_common(1)[0]
+        # Each count is answered from one of the two edge indexes, without reading any links into Python
+        cursor.execute('SELECT COUNT(*), COUNT(DISTINCT dst_id) FROM edges;')
+        link_count, data['visits'] = cursor.fetchone()
+        data['average_links'] = link_count / data['count'] if data['count'] else 0.0
+
+        get_most_links = '''
+        SELECT titles.title, counts.links
+        FROM (SELECT src_id, COUNT(*) AS links FROM edges GROUP BY src_id ORDER BY links DESC LIMIT 1) counts
+        JOIN titles ON titles.id = counts.src_id;
+        '''
+        cursor.execute(get_most_links)
+        data['most_links'] = cursor.fetchone() or ('', 0)
+
+        get_most_common = '''
+        SELECT titles.title, counts.links
+        FROM (SELECT dst_id, COUNT(*) AS links FROM edges GROUP BY dst_id ORDER BY links DESC LIMIT 1) counts
+        JOIN titles ON titles.id = counts.dst_id;
+        '''
+        cursor.execute(get_most_common)
+        data['most_common'] = cursor.fetchone() or ('', 0)
 
         bytes = os.path.getsize(database_name)
 
@@ -167,16 +230,50 @@ def make_dict(database_name: str = CONFIG['database_file']) -> None:
     try:
         conn = sqlite3.connect(database_name)
         cursor = conn.cursor()
-        
-        select = "SELECT * FROM pages;"
-        cursor.execute(select)
 
-        for item in cursor.fetchall():
-            graph[item[0]] = unpack_list(item[1])
+        cursor.execute("SELECT id, title FROM titles;")
+        titles = dict(cursor.fetchall())
+
+        cursor.execute("SELECT id FROM titles WHERE logged;")
+        for id, in cursor.fetchall():
+            graph[titles[id]] = []
+
+        # Rows come out in primary key order, so each page's links arrive together
+        cursor.execute("SELECT src_id, dst_id FROM edges;")
+        for src_id, dst_id in cursor:
+            graph[titles[src_id]].append(titles[dst_id])
     except sqlite3.Error as e:
         print(f"An error occurred: {e}")
     finally: 
         conn.close()
         return graph
-        
-adv_database_analysis()
\ No newline at end of file
+
+def make_reverse_dict(graph: dict = None, database_name: str = CONFIG['database_file']) -> dict:
+    '''Map every page to the logged pages that link to it, from make_dict() or straight from the edges table'''
+    reverse = {}
+    if graph is not None:
+        for page, links in graph.items():
+            for link in links:
+                reverse.setdefault(link, []).append(page)
+        return reverse
+
+    try:
+        conn = sqlite3.connect(database_name)
+        cursor = conn.cursor()
+
+        cursor.execute("SELECT id, title FROM titles;")
+        titles = dict(cursor.fetchall())
+
+        # Ordered by target, so the planner reads the reverse index and each page's backlinks arrive together
+        cursor.execute("SELECT src_id, dst_id FROM edges ORDER BY dst_id;")
+        for src_id, dst_id in cursor:
+            reverse.setdefault(titles[dst_id], []).append(titles[src_id])
+    except sqlite3.Error as e:
+        print(f"An error occurred: {e}")
+    finally:
+        conn.close()
+        return reverse
+
+
+if __name__ == '__main__':
+    adv_database_analysis()
@@ -3,6 +3,7 @@
 from collections import deque
 from scraping import scrape_page, scrape_page_in_memory
 import tools, database_tools
+import asyncio
 from time import time
 import threading, os
 from concurrent.futures import ThreadPoolExecutor
@@ -144,6 +145,162 @@ def bfs_in_memory_with_threading(start_page: str, goal_page: str, update: bool =
     finally:
         conn.close()
 
+def bidirectional_bfs(start_page: str, goal_page: str, update: bool = False, defer: bool = True, sleep_timer: float = 0.01, debug: bool = False) -> list:
+    '''Search forward from start_page and backward from goal_page over known backlinks, a whole level of the smaller frontier at a time, until they meet'''
+    global CONFIG
+
+    graph = database_tools.make_dict()
+    reverse = database_tools.make_reverse_dict(graph)
+    print("Data loaded to memory")
+    conn = database_tools.create_connection()
+
+    print(f"Pathing from {start_page} to {goal_page} in both directions")
+
+    if start_page == goal_page:
+        conn.close()
+        return [start_page]
+
+    # For each side, the page every page was reached from and how many hops from its end it is
+    forward_parents, forward_depths, forward_frontier = {start_page: None}, {start_page: 0}, [start_page]
+    backward_parents, backward_depths, backward_frontier = {goal_page: None}, {goal_page: 0}, [goal_page]
+
+    def forward_links(page: str) -> list:
+        result = scrape_page_in_memory(CONFIG, graph, page, update=update, defer=defer, sleep_timer=sleep_timer, debug=debug)
+        if not result:
+            return []
+
+        links, new_flag = result
+        if links and new_flag:
+            database_tools.insert_page(page, links, conn, debug)
+            for link in links:  # Newly scraped pages are backlinks too
+                reverse.setdefault(link, []).append(page)
+        return links or []
+
+    def backward_links(page: str) -> list:
+        return reverse.get(page, [])
+
+    def expand(frontier: list, links_of, parents: dict, depths: dict, other_depths: dict) -> tuple[list, str]:
+        # Every page of the level is expanded before stopping, so the shortest meeting is found
+        next_frontier = []
+        meeting, shortest = None, None
+        for page in frontier:
+            if debug:
+                print(f"Visiting: {page}")
+
+            for link in links_of(page):
+                if link not in parents:
+                    parents[link] = page
+                    depths[link] = depths[page] + 1
+                    next_frontier.append(link)
+                if link in other_depths and (shortest is None or depths[link] + other_depths[link] < shortest):
+                    meeting, shortest = link, depths[link] + other_depths[link]
+        return next_frontier, meeting
+
+    try:
+        while forward_frontier:
+            # Backlinks are only known for logged pages, so once they run out the search carries on forward alone
+            if backward_frontier and len(backward_frontier) < len(forward_frontier):
+                backward_frontier, meeting = expand(backward_frontier, backward_links, backward_parents, backward_depths, forward_depths)
+            else:
+                forward_frontier, meeting = expand(forward_frontier, forward_links, forward_parents, forward_depths, backward_depths)
+
+            if meeting:
+                path = []
+                pop = meeting
+                while pop:
+                    path.append(pop)
+                    pop = forward_parents[pop]
+                path.reverse()
+
+                pop = backward_parents[meeting]
+                while pop:
+                    path.append(pop)
+                    pop = backward_parents[pop]
+                return path
+        return []
+    except KeyboardInterrupt:
+        raise
+    finally:
+        conn.close()
+
+def bfs_csr(start_page: str, goal_page: str, rebuild: bool = False, debug: bool = False) -> list:
+    '''Path over the saved CSR graph without scraping, building and saving it from the database first if needed'''
+    global CONFIG
+    from csr_graph import CSRGraph  # Needs numpy, so only loaded for this search
+
+    directory = CONFIG['csr_graph']
+    if rebuild or not os.path.exists(os.path.join(directory, 'offsets.npy')):
+        CSRGraph.from_database().save(directory)
+    graph = CSRGraph.load(directory)
+    print(f"Graph of {len(graph)} pages mapped")
+
+    print(f"Pathing from {start_page} to {goal_page}")
+    return graph.bfs(start_page, goal_page, debug)
+
+async def bfs_async(start_page: str, goal_page: str, defer: bool = True, max_in_flight: int = 8, rate: float = 10.0, base_url: str = 'https://en.wikipedia.org/wiki/',
+                    database_name: str = CONFIG['database_file'], debug: bool = False) -> list:
+    '''Breadth first search that keeps up to max_in_flight pages being fetched at once, in queue order; run with asyncio.run()'''
+    global CONFIG
+    from crawler import Crawler  # Needs aiohttp, so only loaded for this search
+
+    graph = database_tools.make_dict(database_name)
+    print("Data loaded to memory")
+    conn = database_tools.create_connection(database_name)
+
+    queue = deque([start_page])
+    parents = {start_page: None}
+
+    print(f"Pathing from {start_page} to {goal_page} with up to {max_in_flight} requests in flight")
+
+    async def expand(crawler: Crawler, page: str) -> tuple[str, list]:
+        if defer and graph.get(page):
+            return page, graph[page]
+
+        links = await crawler.scrape(page)
+        if links:
+            graph[page] = links
+            database_tools.insert_page(page, links, conn, debug)
+        return page, links or []
+
+    if start_page == goal_page:
+        conn.close()
+        return [start_page]
+
+    try:
+        async with Crawler(CONFIG, base_url=base_url, concurrency=max_in_flight, rate=rate, debug=debug) as crawler:
+            # Fetches run concurrently, but results are taken strictly in the order pages left the queue, as a plain BFS
+            # would take them, so a deeper page that happens to finish first can never set a parent or reach the goal early
+            in_flight = deque()
+            try:
+                while queue or in_flight:
+                    while queue and len(in_flight) < max_in_flight:
+                        pop = queue.popleft()
+                        if debug:
+                            print(f"Visiting: {pop}")
+                        in_flight.append(asyncio.create_task(expand(crawler, pop)))
+
+                    pop, links = await in_flight.popleft()
+                    for link in links:
+                        if link not in parents:
+                            parents[link] = pop
+                            queue.append(link)
+
+                        # The goal is recognised as soon as a page links to it, without fetching it
+                        if link == goal_page:
+                            path = []
+                            while link:
+                                path.append(link)
+                                link = parents[link]
+                            return path[::-1]
+                return []
+            finally:
+                # Fetches still in flight are abandoned before the session closes
+                for task in in_flight:
+                    task.cancel()
+                await asyncio.gather(*in_flight, return_exceptions=True)
+    finally:
+        conn.close()
+
 def optimal_worker_count():
     cpu_cores = os.cpu_count()
     return cpu_cores * 2 if cpu_cores else 4
@@ -1,10 +1,53 @@
 '''Methods for scraping actual data from wikipedia'''
 
 from requests import get
-from bs4 import BeautifulSoup # type: ignore
+from html import unescape
+import re
 import tools, database_tools
 from time import sleep
 
+# One pass over the raw html finds every <a> tag. Everything else html.parser reads as a unit is matched whole too, so
+# text inside it is never mistaken for a link: comments, CDATA, declarations, end tags, other tags with their quoted
+# attribute values, and script, style, title and textarea blocks, whose contents are raw text (as in browsers and recent
+# html.parser; older versions still read tags inside title and textarea). Tags are read with html.parser's own grammar,
+# taking its first reading inside a lookahead so a tag that fails to close is never retried every other way, and a tag
+# it cannot read is skipped the same way. This assumes markup a parser accepts without repairs, as wikipedia serves; on
+# badly broken html the two can still disagree
+ATTRIBUTE_PATTERN = re.compile(r'''(?<=['"\s/])([^\s/>][^\s/=>]*)(?:\s*=+\s*('[^']*'|"[^"]*"|(?!['"])[^>\s]*))?(?:\s|/(?!>))*''')
+TAG = rf'''[^\t\n\r\f />\x00]*(?:[\s/]*{ATTRIBUTE_PATTERN.pattern})*\s*'''
+LINK_PATTERN = re.compile(rf'''
+    <!--.*?-->
+  | <!\[CDATA\[.*?\]\]>
+  | <[!?/][^>]*>
+  | <(?P<raw>script|style|title|textarea)(?=[\s/>]).*?(?:</\s*(?P=raw)\s*>|\Z)
+  | (?=(?P<anchor><a(?=[\s/>]){TAG}))(?P=anchor)/?>
+  | (?=(?P<tag><[a-z]{TAG}))(?:(?P=tag)/?>|(?=(?P=tag)(?:[a-z=/]|\Z))<[^>]*>|(?P=tag))
+''', re.IGNORECASE | re.DOTALL | re.VERBOSE)
+
+def extract_links(CONFIG: dict, html: str, page: str) -> list:
+    '''Return the distinct article links in a page's html, in order'''
+    global_pages = set(CONFIG['global_pages'])
+
+    links = []
+
+    for match in LINK_PATTERN.finditer(html):
+        anchor = match['anchor']
+        if anchor is None:
+            continue
+
+        href = '' # The last href wins, as in BeautifulSoup
+        for name, value in ATTRIBUTE_PATTERN.findall(anchor, 2):
+            if name.lower() == 'href':
+                href = value[1:-1] if value[:1] in ('"', "'") else value
+        if '&' in href:
+            href = unescape(href)
+        if href.startswith('/wiki/') and ':' not in href and '#' not in href and "List_of_" not in href and "disambiguation" not in href: # links and not namespaces or lists
+            href = href[6:]
+            if href not in global_pages and href != page:
+                links.append(href)
+
+    return list(dict.fromkeys(links))
+
 def scrape_page(CONFIG: dict, conn, page: str, defer: bool = True, update: bool = False, sleep_timer: float = 0.01, debug: bool = False, ) -> tuple[list, bool]: 
     '''Return list of links on page'''
     sleep(sleep_timer)
@@ -29,24 +72,15 @@ def scrape_page(CONFIG: dict, conn, page: str, defer: bool = True, update: bool
         if page:
             full_url = base_url + page
             response = get(full_url)
-            soup = BeautifulSoup(response.text, 'html.parser')
             if response.status_code == 429:
                 print("Oh we fucked up my bad wikipedia")
                 quit()
 
-            links = []
-
-            for tag in soup.find_all('a', href=True):
-                href = tag['href'] # /wiki/[link]
-                if href.startswith('/wiki/') and ':' not in href and '#' not in href and "List_of_" not in href and "disambiguation" not in href: # links and not namespaces or lists
-                    href = href[6:]
-                    if href not in CONFIG['global_pages'] and href != page:
-                        links.append(href)
+            links = extract_links(CONFIG, response.text, page)
 
             if links == ['Case_sensitivity']: 
                 print(f"Page ({page}) does not exist")
                 
-            links = list(dict.fromkeys(links))
             if update:
                 tools.write_file(page, links)
             #graph[page] = links
@@ -80,24 +114,15 @@ def scrape_page_in_memory(CONFIG: dict, graph: dict, page: str, defer: bool = Tr
         if page:
             full_url = base_url + page
             response = get(full_url)
-            soup = BeautifulSoup(response.text, 'html.parser')
             if response.status_code == 429:
                 print("Oh we fucked up my bad wikipedia")
                 quit()
 
-            links = []
-
-            for tag in soup.find_all('a', href=True):
-                href = tag['href'] # /wiki/[link]
-                if href.startswith('/wiki/') and ':' not in href and '#' not in href and "List_of_" not in href and "disambiguation" not in href: # links and not namespaces or lists
-                    href = href[6:]
-                    if href not in CONFIG['global_pages'] and href != page:
-                        links.append(href)
+            links = extract_links(CONFIG, response.text, page)
 
             if links == ['Case_sensitivity']: 
                 print(f"Page ({page}) does not exist")
                 
-            links = list(dict.fromkeys(links))
             if update:
                 tools.write_file(page, links)
             graph[page] = links
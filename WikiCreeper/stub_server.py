@@ -0,0 +1,110 @@
+'''Local stand-in for wikipedia, for checking the crawler without touching the network'''
+
+import asyncio, os, random, sys, tempfile
+from collections import deque
+from aiohttp import web
+import tools, database_tools
+from crawler import Crawler
+from pathing import bfs_async
+
+CONFIG = tools.initialize_configs()
+
+def make_graph(pages: int = 400, links: int = 6, seed: int = 0) -> dict:
+    '''Random graph of page titles to the titles they link to'''
+    generator = random.Random(seed)
+    titles = [f"Page_{i}" for i in range(pages)]
+    return {title: [link for link in generator.sample(titles, links) if link != title] for title in titles}
+
+def shortest_path_length(graph: dict, start: str, goal: str) -> int | None:
+    '''Hops on the shortest path from start to goal by a plain BFS, or None if there is none'''
+    depths = {start: 0}
+    queue = deque([start])
+    while queue:
+        page = queue.popleft()
+        if page == goal:
+            return depths[page]
+        for link in graph.get(page, []):
+            if link not in depths:
+                depths[link] = depths[page] + 1
+                queue.append(link)
+    return None
+
+def make_app(graph: dict, fail_every: int = 5, retry_after: float = 0.1) -> web.Application:
+    '''
+    Serve each page of graph at /wiki/<title> with a link to every page it links to. Every fail_every-th page answers
+    429 with a Retry-After header first and 503 second, before answering normally, and pages take from 10 to 70ms to answer. app['stats'] counts requests
+    and the most that were in flight at once
+    '''
+    index = {title: i for i, title in enumerate(graph)}
+    attempts = {}
+    stats = {'requests': 0, 'in_flight': 0, 'max_in_flight': 0}
+
+    async def page(request: web.Request) -> web.Response:
+        title = request.match_info['title']
+        stats['requests'] += 1
+        stats['in_flight'] += 1
+        stats['max_in_flight'] = max(stats['max_in_flight'], stats['in_flight'])
+        try:
+            if title not in graph:
+                await asyncio.sleep(0.01)
+                return web.Response(status=404)
+            await asyncio.sleep(0.01 * (1 + index[title] % 7))  # Pages answer at different speeds, so fetches finish out of order
+
+            attempt = attempts[title] = attempts.get(title, 0) + 1
+            if index[title] % fail_every == 0 and attempt == 1:
+                return web.Response(status=429, headers={'Retry-After': str(retry_after)})
+            if index[title] % fail_every == 0 and attempt == 2:
+                return web.Response(status=503)
+
+            body = ''.join(f'<a href="/wiki/{link}">{link}</a>\n' for link in graph[title])
+            return web.Response(text=f'<html><body>{body}<a href="/wiki/File:Logo.png">logo</a></body></html>', content_type='text/html')
+        finally:
+            stats['in_flight'] -= 1
+
+    app = web.Application()
+    app['stats'] = stats
+    app.router.add_get('/wiki/{title}', page)
+    return app
+
+async def check_crawler(host: str = '127.0.0.1', port: int = 8765, concurrency: int = 8, queries: int = 20) -> bool:
+    '''Scrape the stub with a Crawler and check bfs_async finds shortest paths through it, printing what was checked'''
+    graph = make_graph()
+    app = make_app(graph)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    await web.TCPSite(runner, host, port).start()
+    base_url = f"http://{host}:{port}/wiki/"
+    passed = True
+
+    try:
+        pages = list(graph)[:100]
+        async with Crawler(CONFIG, base_url=base_url, concurrency=concurrency, rate=100.0, backoff=0.05, retries=3) as crawler:
+            results = await crawler.scrape_many(pages + ['Missing_page'])
+
+        scraped = all(results.get(page) == graph[page] for page in pages) and 'Missing_page' not in results
+        bounded = app['stats']['max_in_flight'] <= concurrency
+        print(f"Scraped {len(results)} of {len(pages)} pages in {app['stats']['requests']} requests, "
+              f"at most {app['stats']['max_in_flight']} in flight: {'ok' if scraped and bounded else 'FAILED'}")
+        passed = passed and scraped and bounded
+
+        # Failing pages finish late, so these searches would find longer paths if results were not taken in queue order
+        generator = random.Random(1)
+        for _ in range(queries):
+            start, goal = generator.sample(list(graph), 2)
+            with tempfile.TemporaryDirectory() as directory:
+                database_name = os.path.join(directory, 'stub.db')
+                database_tools.create_table(database_name)
+                path = await bfs_async(start, goal, max_in_flight=concurrency, rate=1000.0, base_url=base_url, database_name=database_name)
+
+            valid = bool(path) and path[0] == start and path[-1] == goal and all(b in graph[a] for a, b in zip(path, path[1:]))
+            shortest = valid and len(path) - 1 == shortest_path_length(graph, start, goal)
+            print(f"bfs_async found {path}: {'ok' if shortest else 'FAILED'}")
+            passed = passed and shortest
+    finally:
+        await runner.cleanup()
+
+    return passed
+
+
+if __name__ == '__main__':
+    sys.exit(0 if asyncio.run(check_crawler()) else 1)
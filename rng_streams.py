@@ -0,0 +1,144 @@
+'''Reproducible, jumpable NumPy random streams shared by the simulation scripts'''
+
+import json
+
+import numpy as np
+
+BIT_GENERATORS = {
+    "PCG64": np.random.PCG64,
+    "PCG64DXSM": np.random.PCG64DXSM,
+    "Philox": np.random.Philox,
+}
+
+
+class RandomStreams:
+    """
+    A family of independent random streams grown from one recorded seed.
+
+    Stream i is the seeded bit generator jumped i times (2^127 draws apart for PCG64, 2^128 for
+    Philox), so streams never overlap and any worker can rebuild its own stream from the seed
+    manifest and its index alone. Every stream, stream 0 included, starts from a fresh copy of
+    the seeded bit generator, so drawing from one never changes the others.
+
+    Parameters:
+    - seed: Anything numpy.random.SeedSequence accepts. Defaults to fresh OS entropy, which is then recorded.
+    - bit_generator (str): 'PCG64', 'PCG64DXSM' or 'Philox'.
+    """
+
+    def __init__(self, seed=None, bit_generator="PCG64"):
+        if bit_generator not in BIT_GENERATORS:
+            raise ValueError(f"Bit generator must be one of {', '.join(BIT_GENERATORS)}, got {bit_generator}")
+
+        self.seed_sequence = seed if isinstance(seed, np.random.SeedSequence) else np.random.SeedSequence(seed)
+        self.bit_generator = bit_generator
+        self._generators = {}
+
+    def generator(self, stream=0):
+        """
+        Get one stream's generator, building it the first time.
+
+        Parameters:
+        - stream (int): Stream index.
+
+        Returns:
+        - generator (np.random.Generator): The same object on every call with the same index.
+        """
+        if stream < 0:
+            raise ValueError("Stream index must be 0 or greater.")
+        if stream not in self._generators:
+            root = BIT_GENERATORS[self.bit_generator](self.seed_sequence)
+            self._generators[stream] = np.random.Generator(root.jumped(stream) if stream else root)
+        return self._generators[stream]
+
+    def generators(self, count, start=0):
+        """
+        Get the generators of consecutive streams, e.g. one per parallel worker or batch.
+        """
+        return [self.generator(stream) for stream in range(start, start + count)]
+
+    def manifest(self):
+        """
+        Everything needed to rebuild these streams exactly.
+
+        Returns:
+        - manifest (dict): JSON-serializable bit generator name, entropy, spawn key and the stream indices handed out so far.
+        """
+        return {
+            "bit_generator": self.bit_generator,
+            "entropy": str(self.seed_sequence.entropy),  # Can exceed 64 bits, so kept as text
+            "spawn_key": list(self.seed_sequence.spawn_key),
+            "streams": sorted(self._generators),
+        }
+
+    @classmethod
+    def from_manifest(cls, manifest):
+        """
+        Rebuild the streams described by manifest().
+        """
+        seed_sequence = np.random.SeedSequence(int(manifest["entropy"]), spawn_key=tuple(manifest["spawn_key"]))
+        return cls(seed_sequence, manifest["bit_generator"])
+
+    def save_manifest(self, file_name):
+        """
+        Write manifest() to a JSON file.
+
+        Raises:
+        - ValueError: If the file could not be written.
+        """
+        try:
+            with open(file_name, "w") as file:
+                json.dump(self.manifest(), file, indent=4)
+        except OSError as e:
+            raise ValueError(f"Could not write seed manifest: {file_name}") from e
+
+    @classmethod
+    def load_manifest(cls, file_name):
+        """
+        Rebuild the streams saved by save_manifest().
+
+        Raises:
+        - ValueError: If the file is missing or is not a seed manifest.
+        """
+        try:
+            with open(file_name, "r") as file:
+                return cls.from_manifest(json.load(file))
+        except (OSError, KeyError, TypeError, json.JSONDecodeError) as e:
+            raise ValueError(f"Could not read seed manifest: {file_name}") from e
+
+
+def as_generator(source=None):
+    """
+    Turn whatever a caller passed as randomness into a generator.
+
+    Parameters:
+    - source: None (fresh entropy), a seed, a SeedSequence, a RandomStreams (its stream 0) or a Generator (used as is).
+
+    Returns:
+    - generator (np.random.Generator)
+    """
+    if isinstance(source, np.random.Generator):
+        return source
+    if isinstance(source, RandomStreams):
+        return source.generator(0)
+    return RandomStreams(source).generator(0)
+
+def fill_integers(generator, high, out, chunk_size=1 << 16):
+    """
+    Fill a preallocated integer buffer with uniform draws from [0, high).
+
+    Draws are made a cache-sized chunk at a time, straight in the buffer's dtype, so refilling
+    the same buffer over and over never allocates more than one chunk.
+
+    Parameters:
+    - generator (np.random.Generator): Where to draw from.
+    - high (int): Exclusive upper bound. Must fit in the buffer's dtype.
+    - out (np.ndarray): One-dimensional integer buffer to fill.
+    - chunk_size (int): Draws made at a time.
+
+    Returns:
+    - out (np.ndarray): The same buffer.
+    """
+    for start in range(0, out.size, chunk_size):
+        stop = min(start + chunk_size, out.size)
+        out[start:stop] = generator.integers(0, high, size=stop - start, dtype=out.dtype)
+    return out
@@ -0,0 +1,19 @@
+import rng_streams, pytest
+import numpy as np
+
+def test_stream_rebuilt_after_stream_0_used():
+    streams = rng_streams.RandomStreams(12345)
+    streams.generator(0).random(1_000)
+    draws = streams.generator(1).random(10)
+
+    rebuilt = rng_streams.RandomStreams.from_manifest(streams.manifest())
+    assert np.array_equal(draws, rebuilt.generator(1).random(10))
+
+@pytest.mark.parametrize('bit_generator', ['PCG64', 'PCG64DXSM', 'Philox'])
+def test_streams_match_manifest_in_any_order(bit_generator):
+    streams = rng_streams.RandomStreams(7, bit_generator)
+    draws = {stream: streams.generator(stream).integers(0, 1 << 30, 5) for stream in (2, 0, 1)}
+
+    rebuilt = rng_streams.RandomStreams.from_manifest(streams.manifest())
+    for stream in (0, 1, 2):
+        assert np.array_equal(draws[stream], rebuilt.generator(stream).integers(0, 1 << 30, 5))